@@ -14,11 +14,8 @@ class Backtest:
         self.strategy = strategy
         self.data = data
 
-    def run(self):
+    def run(self) -> None:
         """
         Runs the backtest by executing the strategy on the historical data.
         """
-        # Execute the strategy on the historical data
         self.strategy.execute(self.data)
-        # Generate performance metrics
-        pass
@@ -3,6 +3,8 @@ from botrading.base.enums import OrderSide, TimeInForce
 
 
 class LimitOrderRequest(OrderRequest):
+    __slots__ = ('symbol', 'quantity', 'side', 'limit_price', 'time_in_force')
+
     def __init__(self, symbol: str, quantity: int, side: OrderSide, limit_price: float, time_in_force: TimeInForce):
         self.symbol = symbol
         self.quantity = quantity
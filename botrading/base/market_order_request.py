@@ -4,6 +4,8 @@ from typing import Optional
 
 
 class MarketOrderRequest(OrderRequest):
+    __slots__ = ('symbol', 'quantity', 'side', 'time_in_force', 'stop_loss_request')
+
     def __init__(self,
                  symbol: str,
                  quantity: int,
@@ -22,5 +24,5 @@ class MarketOrderRequest(OrderRequest):
             'quantity': self.quantity,
             'side': self.side,
             'time_in_force': self.time_in_force,
-            'stop_loss_request': self.stop_loss_request.to_dict()
+            'stop_loss_request': self.stop_loss_request.to_dict() if self.stop_loss_request is not None else None
         }
\ No newline at end of file
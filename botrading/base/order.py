@@ -4,7 +4,29 @@ from typing import Optional
 from botrading.base.enums import OrderSide, OrderType, OrderStatus
 
 
+def _build_enum_lookup(enum_cls) -> dict:
+    # Map the lower case enum values, their upper case variants and the members themselves to the enum members
+    lookup = {member.value: member for member in enum_cls}
+    lookup.update({member.value.upper(): member for member in enum_cls})
+    lookup.update({member: member for member in enum_cls})
+    return lookup
+
+
+_ORDER_SIDE_LOOKUP = _build_enum_lookup(OrderSide)
+_ORDER_TYPE_LOOKUP = _build_enum_lookup(OrderType)
+_ORDER_STATUS_LOOKUP = _build_enum_lookup(OrderStatus)
+
+
+def _lookup_enum(lookup: dict, enum_cls, value):
+    member = lookup.get(value)
+    # Fall back to the enum constructor for mixed case or enum-like values
+    return member if member is not None else enum_cls(value.lower())
+
+
 class Order:
+    __slots__ = ('id', 'client_order_id', 'created_at', 'side', 'order_type', 'symbol', 'quantity', 'status',
+                 'filled_quantity', 'filled_avg_price', 'stop_price', 'limit_price', 'extended_hours')
+
     def __init__(self, id: UUID, client_order_id: str, created_at: datetime, side: OrderSide, order_type: OrderType,
                  symbol: str, quantity: float, status: OrderStatus, filled_quantity: float = 0.0, filled_avg_price: Optional[float] = None,
                  stop_price: Optional[float] = None, limit_price: Optional[float] = None, extended_hours: bool = False):
@@ -24,67 +46,82 @@ class Order:
 
     def to_dict(self):
         return {
-            'id': str(self.id) if self.id else None,
-            'client_order_id': self.client_order_id if self.client_order_id else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'side': self.side.value if self.side else None,
-            'order_type': self.order_type.value if self.order_type else None,
-            'symbol': self.symbol if self.symbol else None,
-            'quantity': self.quantity if self.quantity else 0.0,
-            'status': self.status.value if self.status else None,
-            'filled_quantity': self.filled_quantity if self.filled_quantity else 0.0,
-            'filled_avg_price': self.filled_avg_price if self.filled_avg_price else 0.0,
-            'stop_price': self.stop_price if self.stop_price else 0.0,
-            'limit_price': self.limit_price if self.limit_price else 0.0,
-            'extended_hours': self.extended_hours if self.extended_hours else False
+            'id': str(self.id) if self.id is not None else None,
+            'client_order_id': self.client_order_id,
+            'created_at': self.created_at.isoformat() if self.created_at is not None else None,
+            'side': self.side.value if self.side is not None else None,
+            'order_type': self.order_type.value if self.order_type is not None else None,
+            'symbol': self.symbol,
+            'quantity': self.quantity if self.quantity is not None else 0.0,
+            'status': self.status.value if self.status is not None else None,
+            'filled_quantity': self.filled_quantity,
+            'filled_avg_price': self.filled_avg_price if self.filled_avg_price is not None else 0.0,
+            'stop_price': self.stop_price if self.stop_price is not None else 0.0,
+            'limit_price': self.limit_price if self.limit_price is not None else 0.0,
+            'extended_hours': self.extended_hours
         }
 
     @classmethod
     def from_dict(cls, data):
+        order_id = data.get('id')
+        side = data.get('side')
+        order_type = data.get('order_type')
+        status = data.get('status')
+        quantity = data.get('quantity')
+        filled_quantity = data.get('filled_quantity')
+        filled_avg_price = data.get('filled_avg_price')
+        stop_price = data.get('stop_price')
+        limit_price = data.get('limit_price')
+        extended_hours = data.get('extended_hours')
+        created_at = data.get('created_at')
+        if isinstance(created_at, str):
+            # to_dict stores the timestamp as an ISO 8601 string
+            created_at = datetime.fromisoformat(created_at) if created_at else None
         return cls(
-            id=str(data['id']) if 'id' in data and data['id'] is not None else None,
-            client_order_id=data['client_order_id'] if 'client_order_id' in data and data['client_order_id'] is not None else None,
-            created_at=data['created_at'] if 'created_at' in data and data['created_at'] is not None else None,
-            side=OrderSide(data['side'].lower()) if 'side' in data and data['side'] is not None else None,
-            order_type=OrderType(data['order_type'].lower()) if 'order_type' in data and data['order_type'] is not None else None,
-            symbol=data['symbol'] if 'symbol' in data and data['symbol'] is not None else None,
-            quantity=data['quantity'] if 'quantity' in data and data['quantity'] is not None else 0.0,
-            status=OrderStatus(data['status'].lower()) if 'status' in data and data['status'] is not None else None,
-            filled_quantity=data['filled_quantity'] if 'filled_quantity' in data and data['filled_quantity'] is not None else 0.0,
-            filled_avg_price=data['filled_avg_price'] if 'filled_avg_price' in data and data['filled_avg_price'] is not None else 0.0,
-            stop_price=data['stop_price'] if 'stop_price' in data and data[
-                'stop_price'] is not None else 0.0,
-            limit_price=data['limit_price'] if 'limit_price' in data and data[
-                'limit_price'] is not None else 0.0,
-            extended_hours=data['extended_hours'] if 'extended_hours' in data and data['extended_hours'] is not None else 0.0,
+            id=str(order_id) if order_id is not None else None,
+            client_order_id=data.get('client_order_id'),
+            created_at=created_at,
+            side=_lookup_enum(_ORDER_SIDE_LOOKUP, OrderSide, side) if side is not None else None,
+            order_type=_lookup_enum(_ORDER_TYPE_LOOKUP, OrderType, order_type) if order_type is not None else None,
+            symbol=data.get('symbol'),
+            quantity=quantity if quantity is not None else 0.0,
+            status=_lookup_enum(_ORDER_STATUS_LOOKUP, OrderStatus, status) if status is not None else None,
+            filled_quantity=filled_quantity if filled_quantity is not None else 0.0,
+            filled_avg_price=filled_avg_price if filled_avg_price is not None else 0.0,
+            stop_price=stop_price if stop_price is not None else 0.0,
+            limit_price=limit_price if limit_price is not None else 0.0,
+            extended_hours=extended_hours if extended_hours is not None else False,
         )
 
 
+_FINAL_STATUSES = frozenset({
+    OrderStatus.FILLED,
+    OrderStatus.DONE_FOR_DAY,
+    OrderStatus.CANCELED,
+    OrderStatus.EXPIRED,
+    OrderStatus.REPLACED,
+    OrderStatus.REJECTED
+})
+
+_PENDING_STATUSES = frozenset({
+    OrderStatus.NEW,
+    OrderStatus.PARTIALLY_FILLED,
+    OrderStatus.PENDING_CANCEL,
+    OrderStatus.PENDING_REPLACE,
+    OrderStatus.PENDING_REVIEW,
+    OrderStatus.PENDING_NEW,
+    OrderStatus.ACCEPTED,
+    OrderStatus.ACCEPTED_FOR_BIDDING,
+    OrderStatus.STOPPED,
+    OrderStatus.SUSPENDED,
+    OrderStatus.CALCULATED,
+    OrderStatus.HELD
+})
+
+
 def is_final_status(status: OrderStatus) -> bool:
-    final_statuses = {
-        OrderStatus.FILLED,
-        OrderStatus.DONE_FOR_DAY,
-        OrderStatus.CANCELED,
-        OrderStatus.EXPIRED,
-        OrderStatus.REPLACED,
-        OrderStatus.REJECTED
-    }
-    return status in final_statuses
+    return status in _FINAL_STATUSES
 
 
 def is_pending_status(status: OrderStatus) -> bool:
-    pending_statuses = {
-        OrderStatus.NEW,
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.PENDING_CANCEL,
-        OrderStatus.PENDING_REPLACE,
-        OrderStatus.PENDING_REVIEW,
-        OrderStatus.PENDING_NEW,
-        OrderStatus.ACCEPTED,
-        OrderStatus.ACCEPTED_FOR_BIDDING,
-        OrderStatus.STOPPED,
-        OrderStatus.SUSPENDED,
-        OrderStatus.CALCULATED,
-        OrderStatus.HELD
-    }
-    return status in pending_statuses
\ No newline at end of file
+    return status in _PENDING_STATUSES
\ No newline at end of file
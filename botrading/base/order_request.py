@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class OrderRequest(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self):
         pass
@@ -1,5 +1,7 @@
 
 class Portfolio:
+    __slots__ = ('name', 'owner', 'groups')
+
     def __init__(self, name, owner):
         self.name = name
         self.owner = owner
@@ -21,10 +23,7 @@ class Portfolio:
             print(f"Error: Group {group_name} not found.")
 
     def get_total_market_value(self):
-        total_value = 0
-        for group in self.groups.values():
-            total_value += group.get_market_value()
-        return total_value
+        return sum(group.get_market_value() for group in self.groups.values())
 
     def list_holdings(self):
         all_holdings = []
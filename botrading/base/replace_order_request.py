@@ -4,6 +4,8 @@ from botrading.base.enums import TimeInForce
 
 
 class ReplaceOrderRequest(OrderRequest):
+    __slots__ = ('quantity', 'time_in_force', 'stop_price', 'limit_price', 'trail', 'client_order_id')
+
     def __init__(self,
                  quantity: Optional[int] = None,
                  time_in_force: Optional[TimeInForce] = None,
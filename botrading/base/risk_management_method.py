@@ -1,9 +1,9 @@
-import random
-import uuid
 from ..enums import RiskManagementType
 
 
 class RiskManagementMethod:
+    __slots__ = ('id', 'name', 'item_type', 'rm_threshold', 'rm_threshold_min', 'rm_threshold_max')
+
     def __init__(self, id=None, name=None, item_type: RiskManagementType = None, rm_threshold=None, rm_threshold_min=None, rm_threshold_max=None):
         """
         Initializes a new RiskManagementMethod with optional parameters.
@@ -16,7 +16,11 @@ class RiskManagementMethod:
             rm_threshold_min (int, optional): The minimum risk management threshold. Defaults to 0.
             rm_threshold_max (int, optional): The maximum risk management threshold. Defaults to 100.
         """
-        self.id = id if id is not None else str(uuid.uuid4())
+        if id is None:
+            # uuid pulls in platform on first import, so only load it when an id has to be generated
+            from uuid import uuid4
+            id = str(uuid4())
+        self.id = id
         self.name = name if name is not None else "Default Name"
         self.item_type = item_type if item_type is not None else RiskManagementType.DEFAULT
         self.rm_threshold = rm_threshold if rm_threshold is not None else 0
@@ -27,5 +31,6 @@ class RiskManagementMethod:
         """
         Randomizes the risk management parameters within the specified min and max thresholds.
         """
-        self.rm_threshold = random.randint(self.rm_threshold_min, self.rm_threshold_max)
+        from random import randint
+        self.rm_threshold = randint(self.rm_threshold_min, self.rm_threshold_max)
 
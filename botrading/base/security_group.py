@@ -1,20 +1,35 @@
+import numpy as np
+
 
 class SecurityGroup:
     def __init__(self, name):
         self.name = name
         self.security_map = {}  # symbol -> Security
+        self.quantity_map = {}  # symbol -> quantity, kept in the same order as security_map
 
     def __repr__(self):
         return f"SecurityGroup(name={self.name}, security_map={self.security_map})"
 
     def add_security(self, security, quantity):
         self.security_map[security.symbol] = security
+        self.quantity_map[security.symbol] = quantity
 
     def remove_security(self, symbol):
         if symbol in self.security_map:
             del self.security_map[symbol]
+            del self.quantity_map[symbol]
         else:
             print(f"Error: {symbol} not found in security_map.")
 
     def list_security_map(self):
         return [security for security in self.security_map.values()]
+
+    def list_holdings(self):
+        return [(security, self.quantity_map[symbol]) for symbol, security in self.security_map.items()]
+
+    def get_market_value(self):
+        # Gather quantities and prices into flat arrays and reduce them with a single dot product
+        count = len(self.security_map)
+        quantities = np.fromiter(self.quantity_map.values(), dtype=np.float64, count=count)
+        prices = np.fromiter((security.market_price for security in self.security_map.values()), dtype=np.float64, count=count)
+        return float(np.vdot(quantities, prices))
@@ -3,6 +3,8 @@ from typing import Optional
 
 
 class StopLossRequest(OrderRequest):
+    __slots__ = ('stop_price', 'limit_price')
+
     def __init__(self, stop_price: float, limit_price: Optional[float] = None):
         self.stop_price = stop_price
         self.limit_price = limit_price
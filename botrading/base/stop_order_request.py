@@ -5,6 +5,8 @@ import uuid
 
 
 class StopOrderRequest(OrderRequest):
+    __slots__ = ('client_order_id', 'symbol', 'quantity', 'side', 'stop_price', 'time_in_force', 'limit_price')
+
     def __init__(self, symbol: str, quantity: float, side: OrderSide, stop_price: float, time_in_force: TimeInForce, limit_price: Optional[float] = None):
         self.client_order_id = str(uuid.uuid4())
         self.symbol = symbol
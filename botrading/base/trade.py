@@ -1,11 +1,21 @@
 import uuid
+import pandas as pd
 from typing import Optional, Union
 from botrading.base.order import Order
 
 
+def _is_missing(value) -> bool:
+    # Missing ids in rows read back from a DataFrame come through as None, an empty string, NaN, pd.NA or NaT
+    if value is None or (isinstance(value, str) and value == ''):
+        return True
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
 class Trade:
-    def __init__(self, trade_id=str(uuid.uuid4()), order: Optional[Union[dict, Order]] = None):
-        self.trade_id = trade_id
+    __slots__ = ('trade_id', 'open_order', 'close_order', 'is_closed', 'is_breakeven_stop_set')
+
+    def __init__(self, trade_id: Optional[str] = None, order: Optional[Union[dict, Order]] = None):
+        self.trade_id = trade_id if trade_id is not None else str(uuid.uuid4())
         self.open_order: Optional[Order] = None
         self.close_order: Optional[Order] = None
         self.is_closed = False
@@ -36,11 +46,23 @@ class Trade:
 
     @classmethod
     def from_dict(cls, data: dict):
-        trade = cls()
-        trade.trade_id = data.get('trade_id')
-        if str(data.get('open_order_id')) and str(data.get('open_order_id')) != 'nan':
+        trade = cls(trade_id=data.get('trade_id'))
+
+        # Nested format produced by to_dict
+        if 'open_order' in data or 'close_order' in data:
+            if data.get('open_order'):
+                trade.open_order = Order.from_dict(data['open_order'])
+            if data.get('close_order'):
+                trade.close_order = Order.from_dict(data['close_order'])
+            trade.is_closed = bool(data.get('is_closed', False))
+            trade.is_breakeven_stop_set = bool(data.get('is_breakeven_stop_set', False))
+            return trade
+
+        # Flat format with prefixed order columns, e.g. a DataFrame row
+        open_order_id = data.get('open_order_id')
+        if not _is_missing(open_order_id):
             order_dict = {
-                'id': str(data.get('open_order_id')),
+                'id': str(open_order_id),
                 'created_at': data.get('open_created_at'),
                 'side': data.get('open_side'),
                 'order_type': data.get('open_order_type'),
@@ -56,9 +78,10 @@ class Trade:
 
             trade.open_order = Order.from_dict(order_dict)
 
-        if str(data.get('close_order_id')) and str(data.get('close_order_id')) != 'nan':
+        close_order_id = data.get('close_order_id')
+        if not _is_missing(close_order_id):
             order_dict = {
-                'id': str(data.get('close_order_id')),
+                'id': str(close_order_id),
                 'created_at': data.get('close_created_at'),
                 'side': data.get('close_side'),
                 'order_type': data.get('close_order_type'),
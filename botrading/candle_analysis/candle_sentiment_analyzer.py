@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -15,38 +16,41 @@ class CandleSentimentAnalyzer:
     def analyze_dataframe(self, df):
         df = df.copy()  # Ensure we are working with a copy of the DataFrame
 
+        # Read the OHLC columns once and reuse them for all ratios
+        open_prices = df['open'].to_numpy(dtype=np.float64)
+        close_prices = df['close'].to_numpy(dtype=np.float64)
+        high_prices = df['high'].to_numpy(dtype=np.float64)
+        low_prices = df['low'].to_numpy(dtype=np.float64)
+        candle_range = high_prices - low_prices
+        body_top = np.maximum(open_prices, close_prices)
+        body_bottom = np.minimum(open_prices, close_prices)
+        previous_close = df['close'].shift(1).to_numpy(dtype=np.float64)
+
         # Calculate various percentages and ratios
-        df['gap_percent'] = (df['open'] - df['close'].shift(1)) / df['close'].shift(1)
-        df['body_to_range_ratio'] = (df['close'] - df['open']).abs() / (df['high'] - df['low'])
-        df['upper_shadow_to_range_ratio'] = (df['high'] - df[['open', 'close']].max(axis=1)) / (df['high'] - df['low'])
-        df['lower_shadow_to_range_ratio'] = (df[['open', 'close']].min(axis=1) - df['low']) / (df['high'] - df['low'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['gap_percent'] = (open_prices - previous_close) / previous_close
+            df['body_to_range_ratio'] = np.abs(close_prices - open_prices) / candle_range
+            df['upper_shadow_to_range_ratio'] = (high_prices - body_top) / candle_range
+            df['lower_shadow_to_range_ratio'] = (body_bottom - low_prices) / candle_range
 
         # Close greater than open sentiment
-        df['close_greater_than_open'] = df.apply(lambda row: 1 if row['close'] > row['open'] else -1, axis=1)
+        close_greater_than_open = np.where(close_prices > open_prices, 1, -1)
+        df['close_greater_than_open'] = close_greater_than_open
 
-        # Calculate rolling averages for the lookback period
-        df['avg_gap_percent'] = df['gap_percent'].rolling(window=self.lookback_period).mean()
-        df['avg_body_to_range_ratio'] = df['body_to_range_ratio'].rolling(window=self.lookback_period).mean()
-        df['avg_upper_shadow_to_range_ratio'] = df['upper_shadow_to_range_ratio'].rolling(window=self.lookback_period).mean()
-        df['avg_lower_shadow_to_range_ratio'] = df['lower_shadow_to_range_ratio'].rolling(window=self.lookback_period).mean()
+        # Calculate rolling averages for the lookback period in a single pass over all ratio columns
+        ratio_columns = ['gap_percent', 'body_to_range_ratio', 'upper_shadow_to_range_ratio', 'lower_shadow_to_range_ratio']
+        avg_columns = [f'avg_{column}' for column in ratio_columns]
+        rolling_means = df[ratio_columns].rolling(window=self.lookback_period).mean()
 
         # Fill NaN values with zeros or other appropriate placeholder to maintain DataFrame length
-        df['avg_gap_percent'].fillna(0, inplace=True)
-        df['avg_body_to_range_ratio'].fillna(0, inplace=True)
-        df['avg_upper_shadow_to_range_ratio'].fillna(0, inplace=True)
-        df['avg_lower_shadow_to_range_ratio'].fillna(0, inplace=True)
+        df[avg_columns] = rolling_means.fillna(0).to_numpy()
 
         # Calculate deviations from average
+        upper_shadow_sign = np.where(open_prices > close_prices, -1, 1)
         df['gap_deviation'] = df['gap_percent'] - df['avg_gap_percent']
-        df['body_to_range_deviation'] = df.apply(
-            lambda row: (row['body_to_range_ratio'] - row['avg_body_to_range_ratio']) * (
-                1 if row['open'] < row['close'] else -1), axis=1)
-        df['upper_shadow_deviation'] = df.apply(
-            lambda row: (row['upper_shadow_to_range_ratio'] - row['avg_upper_shadow_to_range_ratio']) * (
-                -1 if row['open'] > row['close'] else 1), axis=1)
-        df['lower_shadow_deviation'] = df.apply(
-            lambda row: (row['lower_shadow_to_range_ratio'] - row['avg_lower_shadow_to_range_ratio']) * (
-                1 if row['open'] > row['close'] else -1), axis=1)
+        df['body_to_range_deviation'] = (df['body_to_range_ratio'] - df['avg_body_to_range_ratio']) * close_greater_than_open
+        df['upper_shadow_deviation'] = (df['upper_shadow_to_range_ratio'] - df['avg_upper_shadow_to_range_ratio']) * upper_shadow_sign
+        df['lower_shadow_deviation'] = (df['lower_shadow_to_range_ratio'] - df['avg_lower_shadow_to_range_ratio']) * -upper_shadow_sign
 
         # Fill NaN deviations with zero to prevent skewing the results
         df.fillna(0, inplace=True)
@@ -54,13 +58,16 @@ class CandleSentimentAnalyzer:
         # Apply weights and calculate weighted sum of deviations
         metrics = ['gap_deviation', 'body_to_range_deviation', 'upper_shadow_deviation', 'lower_shadow_deviation', 'close_greater_than_open']
 
-        df['weighted_score'] = df.apply(lambda row: sum(self.weights[metric] * row[metric] for metric in metrics), axis=1)
+        weights = np.array([self.weights[metric] for metric in metrics], dtype=np.float64)
+        df['weighted_score'] = df[metrics].to_numpy(dtype=np.float64) @ weights
 
         # Standardize the sentiment score to a scale of 1 to 100 and round to integers
         min_score = df['weighted_score'].min()
         max_score = df['weighted_score'].max()
         if max_score != min_score:
-            df['candle_sentiment'] = df['weighted_score'].apply(lambda x: int(round(1 + 99 * (x - min_score) / (max_score - min_score))))
+            # np.rint rounds half to even like the built-in round
+            scores = df['weighted_score'].to_numpy()
+            df['candle_sentiment'] = np.rint(1 + 99 * (scores - min_score) / (max_score - min_score)).astype(np.int64)
         else:
             df['candle_sentiment'] = 50  # If all scores are the same, assign a neutral sentiment
 
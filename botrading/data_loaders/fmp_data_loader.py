@@ -1,9 +1,297 @@
 import os
+import logging
+import time
+import asyncio
+import importlib.util
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
-from ..utils.df_utils import standardize_ohlcv_dataframe
+import pyarrow as pa
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Union
 
+logger = logging.getLogger(__name__)
+
+# httpx is optional and only needed for the async fetch methods
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# ijson is optional and only needed to stream large screener results
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Seconds to wait for the FMP API to connect and to send a response
+_REQUEST_TIMEOUT = (3.05, 30)
+
+# Maximum number of pooled keep-alive connections to the FMP host
+_POOL_SIZE = 32
+
+# Errors a fetch method reports and turns into an empty result: network and HTTP errors (RequestException), undecodable
+# or malformed responses (ValueError, KeyError) and cache files that can't be read or written (OSError, ArrowException).
+# Anything else, TypeError included, is a bug and propagates.
+_FETCH_ERRORS = (requests.RequestException, ValueError, KeyError, OSError, pa.ArrowException)
+
+# Response validators stored with cached responses and the request headers that revalidate them
+_VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+# Maximum number of decoded responses kept in memory, the least recently used ones are evicted first
+_MEMORY_CACHE_SIZE = 1024
+
+# Upper bound in seconds for how long cached news and social sentiment responses stay valid, they change during the day
+_NEWS_CACHE_TTL = 900
+
+# FMP endpoints, the API key is attached by the session
+_BASE_URL_V3 = "https://financialmodelingprep.com/api/v3"
+_SCREENER_URL = f"{_BASE_URL_V3}/stock-screener"
+_DIVIDEND_CALENDAR_URL = f"{_BASE_URL_V3}/stock_dividend_calendar"
+_HISTORICAL_PRICES_URL = _BASE_URL_V3 + "/historical-price-full/{symbol}"
+_HISTORICAL_DIVIDENDS_URL = _BASE_URL_V3 + "/historical-price-full/stock_dividend/{symbol}"
+_HISTORICAL_SPLITS_URL = _BASE_URL_V3 + "/historical-price-full/stock_split/{symbol}"
+_TRADABLE_LIST_URL = f"{_BASE_URL_V3}/available-traded/list"
+_GRADE_URL = _BASE_URL_V3 + "/grade/{symbol}"
+_INCOME_GROWTH_URL = _BASE_URL_V3 + "/income-statement-growth/{symbol}"
+_RATIOS_URL = _BASE_URL_V3 + "/ratios/{symbol}"
+_STOCK_NEWS_URL = f"{_BASE_URL_V3}/stock_news"
+_REAL_TIME_PRICES_URL = f"{_BASE_URL_V3}/stock/full/real-time-price"
+_EARNINGS_CALENDAR_URL = f"{_BASE_URL_V3}/earning_calendar"
+_ANALYST_ESTIMATES_URL = _BASE_URL_V3 + "/analyst-estimates/{symbol}"
+_EARNINGS_SURPRISES_URL = _BASE_URL_V3 + "/earnings-surprises/{symbol}"
+_BASE_URL_V4 = "https://financialmodelingprep.com/api/v4"
+_SOCIAL_SENTIMENT_URL = f"{_BASE_URL_V4}/historical/social-sentiment"
+_INSTITUTIONAL_OWNERSHIP_URL = f"{_BASE_URL_V4}/institutional-ownership/symbol-ownership"
+_INSIDER_TRADING_URL = f"{_BASE_URL_V4}/insider-trading"
+_PRICE_TARGET_URL = f"{_BASE_URL_V4}/price-target"
+
+# Numeric fields of the FMP price and dividend records that are always floats
+_PRICE_FLOAT_FIELDS = frozenset(['open', 'high', 'low', 'close', 'adjClose', 'unadjustedVolume', 'change', 'changePercent',
+                                 'vwap', 'changeOverTime'])
+_DIVIDEND_FLOAT_FIELDS = frozenset(['adjDividend', 'dividend'])
+
+# FMP price fields whose standardized name is not just the lower case name
+_PRICE_COLUMN_NAMES = {'adjClose': 'adj_close'}
+_SCREENER_FLOAT_FIELDS = frozenset(['marketCap', 'beta', 'price', 'lastAnnualDividend'])
+_REAL_TIME_PRICE_FLOAT_FIELDS = frozenset(['bidPrice', 'askPrice', 'lastSalePrice', 'fmpLast'])
+_EARNINGS_FLOAT_FIELDS = frozenset(['eps', 'epsEstimated', 'revenue', 'revenueEstimated'])
+
+# Screener arguments and the API parameters they map to
+_SCREENER_PARAMS = (
+    ('exchange_list', 'exchange'),
+    ('limit', 'limit'),
+    ('market_cap_more_than', 'marketCapMoreThan'),
+    ('market_cap_lower_than', 'marketCapLowerThan'),
+    ('price_more_than', 'priceMoreThan'),
+    ('price_lower_than', 'priceLowerThan'),
+    ('beta_more_than', 'betaMoreThan'),
+    ('beta_lower_than', 'betaLowerThan'),
+    ('volume_more_than', 'volumeMoreThan'),
+    ('volume_lower_than', 'volumeLowerThan'),
+    ('dividend_more_than', 'dividendMoreThan'),
+    ('dividend_lower_than', 'dividendLowerThan'),
+    ('is_etf', 'isEtf'),
+    ('is_fund', 'isFund'),
+    ('is_actively_trading', 'isActivelyTrading'),
+    ('sector', 'sector'),
+    ('industry', 'industry'),
+    ('country', 'country'),
+    ('exchange', 'exchange')
+)
+
+# Fields with few distinct values, stored as categories
+_SCREENER_CATEGORY_FIELDS = ('sector', 'industry', 'exchange', 'exchangeShortName', 'country')
+_GRADE_CATEGORY_FIELDS = ('symbol', 'gradingCompany', 'previousGrade', 'newGrade', 'action')
+_NEWS_CATEGORY_FIELDS = ('symbol', 'site')
+
+# Columns of the standardized daily prices frame, used to return an empty frame with the same schema when there is no data
+_OHLCV_SCHEMA = {
+    'date': 'datetime64[ns]',
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'adj_close': 'float64',
+    'volume': 'int64',
+    'unadjustedvolume': 'float64',
+    'change': 'float64',
+    'changepercent': 'float64',
+    'vwap': 'float64',
+    'label': 'object',
+    'changeovertime': 'float64'
+}
+_EMPTY_OHLCV = pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in _OHLCV_SCHEMA.items()}).set_index('date')
+
+
+def _to_float64(values: list) -> np.ndarray:
+    # Missing and non-numeric values become NaN
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype(np.float64).to_numpy()
+
+
+def _records_to_frame(records: list, float_fields: frozenset) -> pd.DataFrame:
+    """
+    Builds a DataFrame from a list of FMP records column by column.
+
+    Known float fields are converted to float64 directly (missing and non-numeric values become NaN), so pandas only has
+    to infer the dtype of the remaining columns. Records with a different set of fields fall back to pd.DataFrame.
+
+    Parameters:
+        records (list): List of record dicts.
+        float_fields (frozenset): Field names stored as float64.
+
+    Returns:
+        pd.DataFrame: DataFrame with one row per record.
+    """
+    fields = records[0].keys()
+    if any(record.keys() != fields for record in records):
+        df = pd.DataFrame(records)
+        float_columns = [field for field in df.columns if field in float_fields]
+        df[float_columns] = df[float_columns].apply(pd.to_numeric, errors='coerce').astype(np.float64)
+        return df
+
+    columns = {}
+    for field in fields:
+        values = [record[field] for record in records]
+        columns[field] = _to_float64(values) if field in float_fields else values
+    return pd.DataFrame(columns, copy=False)
+
+
+def _combine_symbol_frames(frames: dict, output_format: str) -> Union[dict, pd.DataFrame]:
+    """
+    Converts per-symbol daily prices into the requested output format.
+
+    Parameters:
+        frames (dict): Symbols as keys and DataFrames indexed by date as values.
+        output_format (str): 'dict' returns the frames unchanged, 'long' one DataFrame with a (symbol, date) index and
+            'wide' one DataFrame indexed by date with (field, symbol) columns.
+
+    Returns:
+        dict | pd.DataFrame: The daily prices in the requested output format.
+    """
+    if output_format == 'dict':
+        return frames
+    if output_format not in ('long', 'wide'):
+        raise ValueError(f"Unknown output format '{output_format}', use 'dict', 'long' or 'wide'")
+
+    # Without results the long frame still gets the price columns and a (symbol, date) index
+    prices_df = pd.concat(frames if frames else {'': _EMPTY_OHLCV}, names=['symbol', 'date'])
+    if output_format == 'wide':
+        prices_df = prices_df.unstack('symbol')
+    return prices_df
+
+
+def _to_categories(df: pd.DataFrame, fields: tuple) -> pd.DataFrame:
+    """
+    Stores repetitive string columns as categories, which keeps one copy per distinct value.
+
+    Parameters:
+        df (pd.DataFrame): The DataFrame to convert.
+        fields (tuple): Column names to convert, missing columns are skipped.
+
+    Returns:
+        pd.DataFrame: The converted DataFrame.
+    """
+    return df.astype({field: 'category' for field in fields if field in df.columns})
+
+
+def _project_records(records: list, columns: list = None, required: tuple = ()) -> list:
+    """
+    Keeps only the requested fields of each record, so unused fields are never turned into DataFrame columns.
+
+    Parameters:
+        records (list): List of record dicts.
+        columns (list): Fields to keep, None keeps all fields.
+        required (tuple): Fields the caller needs regardless of columns.
+
+    Returns:
+        list: The projected records.
+    """
+    if columns is None:
+        return records
+    fields = list(dict.fromkeys([*required, *columns]))
+    return [{field: record.get(field) for field in fields} for record in records]
+
+
+def _log_retries(response, *args, **kwargs):
+    # Response hook that reports requests which only succeeded after urllib3 retried them
+    retries = getattr(response.raw, 'retries', None)
+    if retries is not None and retries.history:
+        logger.info("%s succeeded after %d retries", urlsplit(response.url).path, len(retries.history))
+
+
+def _read_cache(path: str) -> Union[pd.DataFrame, None]:
+    """
+    Reads a cached DataFrame from a Parquet file.
+
+    Parameters:
+        path (str): Path of the cache file.
+
+    Returns:
+        pd.DataFrame: The cached DataFrame or None if the file does not exist or can't be read.
+    """
+    try:
+        return pd.read_parquet(path, engine='pyarrow')
+    except FileNotFoundError:
+        return None
+    except (OSError, pa.ArrowException) as ex:
+        # A damaged cache file is treated as a cache miss, the data is fetched again and overwrites it
+        logger.warning("Ignoring unreadable cache file %s: %s", path, ex)
+        return None
+
+
+def _open_temp_file(path: str):
+    """
+    Opens a uniquely named temporary file next to a cache file, so concurrent writers of the same cache file never share
+    a temporary file. The cache directory is only created when it is missing, instead of on every write.
+
+    Parameters:
+        path (str): Path of the cache file.
+
+    Returns:
+        tuple: The open binary file and its path.
+    """
+    directory = os.path.dirname(path) or '.'
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    return os.fdopen(fd, 'wb'), temp_path
+
+
+def _write_cache(df: pd.DataFrame, path: str, index: bool = True):
+    """
+    Atomically writes a DataFrame to a Parquet cache file, so readers never see a partially written file. A failed
+    write is logged and otherwise ignored, the caller still returns the data it fetched.
+
+    Parameters:
+        df (pd.DataFrame): DataFrame to cache.
+        path (str): Path of the cache file.
+        index (bool): Store the index?
+    """
+    temp_path = None
+    try:
+        file, temp_path = _open_temp_file(path)
+        with file:
+            df.to_parquet(file, engine='pyarrow', compression='snappy', index=index)
+        os.replace(temp_path, path)
+    except (OSError, pa.ArrowException) as ex:
+        logger.warning("Failed to write cache file %s: %s", path, ex)
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
 
 class FmpDataLoader:
     """
@@ -13,14 +301,172 @@ class FmpDataLoader:
         api_key (str): FMP API key.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, response_cache_dir: str = None, response_cache_ttl: int = 86400, memory_cache_ttl: int = 0,
+                 max_workers: int = 16, float_dtype: str = 'float64'):
         """
         Initializes the FmpDataLoader with the given API key.
 
         Parameters:
             api_key (str): FMP API key.
+            response_cache_dir (str): Directory to cache raw API responses in. Responses are not cached when None.
+            response_cache_ttl (int): Number of seconds a cached API response stays valid.
+            memory_cache_ttl (int): Number of seconds decoded responses are shared in memory between calls of any
+                fetch method, 0 disables it. Methods with their own memory_cache_ttl argument use that instead.
+            max_workers (int): Default number of concurrent requests of the fetch_multiple_* methods, tune it to the
+                FMP rate limit of the plan.
+            float_dtype (str): Dtype of the float columns in returned price, screener and fundamentals frames. 'float32'
+                halves their memory at about 7 significant digits of precision, cached data is always stored as float64.
         """
         self._api_key = api_key
+        self._response_cache_dir = response_cache_dir
+        self._response_cache_ttl = response_cache_ttl
+        self._memory_cache_ttl = memory_cache_ttl
+        self._max_workers = max_workers
+        self._float_dtype = float_dtype
+        # In-process LRU cache of decoded responses: (url, params) -> (expiry time, data), shared by the worker threads
+        self._memory_cache = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+
+        # Reuse one session so keep-alive connections to the FMP host are shared across calls
+        self._session = requests.Session()
+        # The API key is attached to every request as a default query parameter
+        self._session.params = {'apikey': api_key}
+        # Transient errors and rate limits are retried by urllib3 on the pooled connection, honoring Retry-After
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=('GET',),
+                      respect_retry_after_header=True)
+        # Every worker thread needs its own pooled connection
+        pool_size = max(_POOL_SIZE, max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.hooks['response'].append(_log_retries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        self._session.close()
+
+    def _cached_get(self, url: str, params: dict = None, ttl: int = None, memory_ttl: int = None):
+        """
+        Sends a GET request and returns the decoded JSON response.
+
+        With a memory_ttl the decoded response is also kept in process, so identical calls within that window skip both
+        the network and the JSON decoding. The cached data is shared between callers and must not be mutated.
+
+        Parameters:
+            url (str): Request URL.
+            params (dict): Query parameters.
+            ttl (int): Seconds a response cached on disk stays valid. Defaults to the loader's response_cache_ttl.
+            memory_ttl (int): Seconds a response cached in memory stays valid, 0 disables the memory cache. Defaults to
+                the loader's memory_cache_ttl.
+
+        Returns:
+            The decoded JSON response.
+        """
+        if memory_ttl is None:
+            memory_ttl = self._memory_cache_ttl
+        if memory_ttl <= 0:
+            return self._disk_cached_get(url, params, ttl)
+
+        key = (url, frozenset(params.items()) if params else None)
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                self._memory_cache.move_to_end(key)
+                return entry[1]
+
+        data = self._disk_cached_get(url, params, ttl)
+        with self._memory_cache_lock:
+            self._memory_cache[key] = (time.monotonic() + memory_ttl, data)
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+        return data
+
+    def _disk_cached_get(self, url: str, params: dict = None, ttl: int = None):
+        """
+        Sends a GET request and returns the decoded JSON response.
+
+        When a response cache directory is configured, the raw response body is stored under a hash of the request URL
+        and served from disk until it is older than the TTL, so repeated calls skip the network round trip. Expired
+        responses stored with an ETag or Last-Modified header are revalidated with a conditional request, and reused
+        without downloading them again when the server answers 304 Not Modified.
+
+        Parameters:
+            url (str): Request URL.
+            params (dict): Query parameters.
+            ttl (int): Seconds a cached response stays valid. Defaults to the loader's response_cache_ttl, 0 disables caching.
+
+        Returns:
+            The decoded JSON response.
+        """
+        if ttl is None:
+            ttl = self._response_cache_ttl
+
+        path = None
+        headers = None
+        if self._response_cache_dir is not None and ttl > 0:
+            request_url = requests.Request('GET', url, params=params).prepare().url
+            path = os.path.join(self._response_cache_dir, f"{hashlib.sha1(request_url.encode()).hexdigest()}.json")
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, 'rb') as file:
+                        return orjson.loads(file.read())
+                with open(f"{path}.meta", 'rb') as file:
+                    validators = orjson.loads(file.read())
+                headers = {_VALIDATOR_HEADERS[name]: value for name, value in validators.items()}
+            except FileNotFoundError:
+                pass
+
+        response = self._session.get(url, params=params, headers=headers, timeout=_REQUEST_TIMEOUT)
+        if response.status_code == 304 and headers:
+            # Unchanged on the server, the cached response is valid for another TTL
+            os.utime(path)
+            with open(path, 'rb') as file:
+                return orjson.loads(file.read())
+        response.raise_for_status()
+        content = response.content
+        data = orjson.loads(content)
+
+        if path is not None:
+            validators = {name: response.headers[name] for name in _VALIDATOR_HEADERS if name in response.headers}
+            try:
+                if validators:
+                    self._write_cache_file(f"{path}.meta", orjson.dumps(validators))
+                else:
+                    try:
+                        os.remove(f"{path}.meta")
+                    except FileNotFoundError:
+                        pass
+                self._write_cache_file(path, content)
+            except OSError as ex:
+                # The response is still returned when it can't be cached. Drop the validators, so they can't revalidate a
+                # cached body they don't belong to
+                logger.warning("Failed to write cache file %s: %s", path, ex)
+                try:
+                    os.remove(f"{path}.meta")
+                except OSError:
+                    pass
+        return data
+
+    @staticmethod
+    def _write_cache_file(path: str, content: bytes):
+        # Write to a temporary file first so concurrent readers never see a partial file
+        file, temp_path = _open_temp_file(path)
+        try:
+            with file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            os.remove(temp_path)
+            raise
 
     def fetch_stock_screener_results(
         self,
@@ -45,7 +491,9 @@ class FmpDataLoader:
         limit=1000,
         cache_data=False,
         cache_dir="cache",
-        file_name="eft_data.csv"
+        file_name="eft_data.parquet",
+        stream=False,
+        columns=None
     ):
         """
         Fetches stock screener results from the FMP API.
@@ -72,96 +520,122 @@ class FmpDataLoader:
             limit (int): Maximum number of results.
             cache_data (bool): Cache data locally?
             cache_dir (str): cache directory
-            file_name (str): cache file name
+            file_name (str): cache file name, stored in Parquet format
+            stream (bool): Parse the response incrementally with ijson to lower peak memory for large limits,
+                bypasses the response cache
+            columns (list): Fields to keep, None keeps all fields
 
         Returns:
             pd.DataFrame: DataFrame with stock screener results.
         """
+        arguments = locals()
         try:
-            path = os.path.join(cache_dir, file_name)
+            # The cache is stored as Parquet, a .csv file name from earlier versions is read once and converted
+            base_name = os.path.splitext(file_name)[0]
+            path = os.path.join(cache_dir, f"{base_name}.parquet")
 
             # Try to load from cache
-            if cache_data and os.path.exists(path):
-                securities_df = pd.read_csv(path)
-                return securities_df
+            if cache_data:
+                securities_df = _read_cache(path)
+                if securities_df is not None:
+                    return self._apply_float_dtype(securities_df)
+                try:
+                    securities_df = pd.read_csv(os.path.join(cache_dir, f"{base_name}.csv"), memory_map=True)
+                    _write_cache(securities_df, path, index=False)
+                    return self._apply_float_dtype(securities_df)
+                except FileNotFoundError:
+                    pass
 
             # Load data remotely
-            url = "https://financialmodelingprep.com/api/v3/stock-screener?"
-            params = {
-                "exchange": exchange_list,
-                "limit": limit,
-                "marketCapMoreThan": market_cap_more_than,
-                "marketCapLowerThan": market_cap_lower_than,
-                "priceMoreThan": price_more_than,
-                "priceLowerThan": price_lower_than,
-                "betaMoreThan": beta_more_than,
-                "betaLowerThan": beta_lower_than,
-                "volumeMoreThan": volume_more_than,
-                "volumeLowerThan": volume_lower_than,
-                "dividendMoreThan": dividend_more_than,
-                "dividendLowerThan": dividend_lower_than,
-                "isEtf": is_etf,
-                "isFund": is_fund,
-                "isActivelyTrading": is_actively_trading,
-                "sector": sector,
-                "industry": industry,
-                "country": country,
-                "exchange": exchange,
-                "apikey": self._api_key
-            }
-
-            # Filter out parameters that are None
-            params = {k: v for k, v in params.items() if v is not None}
-
-            response = requests.get(url, params=params)
-
-            if response.status_code == 200:
-                securities_data = response.json()
-                if securities_data:
-                    securities_df = pd.DataFrame(securities_data)
-
-                    # Cache locally if requested
-                    if cache_data:
-                        os.makedirs(cache_dir, exist_ok=True)
-                        securities_df.to_csv(path, index=False)
-
-                    return securities_df
-                return None
+            url = _SCREENER_URL
+            # Only parameters that are set are sent, a later entry for the same API name overrides an earlier one
+            params = {api_name: arguments[name] for name, api_name in _SCREENER_PARAMS if arguments[name] is not None}
+
+            if stream:
+                securities_df = self._stream_records_to_frame(url, params=params, columns=columns, float_fields=_SCREENER_FLOAT_FIELDS)
             else:
-                return None
-        except Exception as ex:
-            print(ex)
+                securities_data = self._cached_get(url, params=params)
+                securities_df = _records_to_frame(_project_records(securities_data, columns), _SCREENER_FLOAT_FIELDS) if securities_data else None
+            if securities_df is not None and not securities_df.empty:
+                securities_df = _to_categories(securities_df, _SCREENER_CATEGORY_FIELDS)
+
+                # Cache locally if requested
+                if cache_data:
+                    _write_cache(securities_df, path, index=False)
+
+                return self._apply_float_dtype(securities_df)
+            return None
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
-    def fetch_dividend_calendar(self, start_date_str: str, end_date_str: str) -> pd.DataFrame:
+    def _stream_records_to_frame(self, url: str, params: dict = None, columns: list = None, prefix: str = 'item',
+                                 float_fields: frozenset = frozenset()) -> pd.DataFrame:
+        """
+        Streams a JSON array of records into column buffers without materializing the list of dicts.
+
+        Parameters:
+            url (str): The endpoint URL.
+            params (dict): Query parameters.
+            columns (list): Fields to keep, None keeps all fields.
+            prefix (str): ijson prefix of the records, 'item' for a top level array.
+            float_fields (frozenset): Field names stored as float64, as _records_to_frame does.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row per record.
+        """
+        if ijson is None:
+            raise Exception("ijson is required for streaming, install it with 'pip install ijson'")
+
+        buffers = {}
+        with self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            row_count = 0
+            for item in ijson.items(response.raw, prefix, use_float=True):
+                if columns is not None:
+                    item = {column: item.get(column) for column in columns}
+                for key, value in item.items():
+                    column = buffers.get(key)
+                    if column is None:
+                        # Key first seen in this record, pad the earlier rows
+                        column = buffers[key] = [None] * row_count
+                    column.append(value)
+                row_count += 1
+                # Pad the columns this record has no value for
+                if len(item) != len(buffers):
+                    for column in buffers.values():
+                        if len(column) < row_count:
+                            column.append(None)
+        for field in float_fields & buffers.keys():
+            buffers[field] = _to_float64(buffers[field])
+        return pd.DataFrame(buffers)
+
+    def fetch_dividend_calendar(self, start_date_str: str, end_date_str: str, memory_cache_ttl: int = 300) -> pd.DataFrame:
         """
         Fetches the dividend calendar from the FMP API.
 
         Parameters:
             start_date_str (str): Start date in 'YYYY-MM-DD' format.
             end_date_str (str): End date in 'YYYY-MM-DD' format.
+            memory_cache_ttl (int): Seconds identical calls are served from memory, 0 always fetches.
 
         Returns:
             pd.DataFrame: DataFrame with dividend calendar data.
         """
         try:
-            url = f"https://financialmodelingprep.com/api/v3/stock_dividend_calendar?from={start_date_str}&to={end_date_str}&apikey={self._api_key}"
-            response = requests.get(url)
-
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    dividend_calendar_df = pd.DataFrame(data)
-                    return dividend_calendar_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
+            params = {'from': start_date_str, 'to': end_date_str}
+            data = self._cached_get(_DIVIDEND_CALENDAR_URL, params=params, memory_ttl=memory_cache_ttl)
+            if data:
+                dividend_calendar_df = _records_to_frame(data, _DIVIDEND_FLOAT_FIELDS)
+                return dividend_calendar_df
+            return None
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
     def fetch_daily_prices_by_date(self, symbol: str, start_date_str: str, end_date_str: str,
-                                   cache_data: bool = False, cache_dir: str = "cache") -> pd.DataFrame:
+                                   cache_data: bool = False, cache_dir: str = "cache", stream: bool = False) -> pd.DataFrame:
         """
         Fetches daily prices by date from the FMP API.
 
@@ -171,122 +645,512 @@ class FmpDataLoader:
             end_date_str (str): End date in 'YYYY-MM-DD' format.
             cache_data (bool): Flag to specify if data should be cached
             cache_dir (str): Directory to cache the data.
+            stream (bool): Parse the response incrementally with ijson to lower peak memory for long date ranges,
+                bypasses the response cache
 
         Returns:
-            pd.DataFrame: DataFrame with daily prices.
+            pd.DataFrame: DataFrame with daily prices, empty if no prices could be fetched.
         """
 
-        file_name = f"{symbol}-{start_date_str}-{end_date_str}-prices.csv"
-        path = os.path.join(cache_dir, file_name)
+        cached_df = None
         if cache_data is True:
-            if os.path.exists(path) is True:
-                prices_df = pd.read_csv(path)
-                prices_df['date'] = pd.to_datetime(prices_df['date'])
-                prices_df.set_index('date', inplace=True)
-                return prices_df
+            cached_df = self._read_daily_prices_cache(symbol, start_date_str, end_date_str, cache_dir)
+        date_ranges = self._get_missing_date_ranges(cached_df, start_date_str, end_date_str)
+        if not date_ranges:
+            return self._slice_daily_prices(cached_df, start_date_str, end_date_str)
 
         try:
-            url = f"https://financialmodelingprep.com/api/v3/historical-price-full/{symbol}?from={start_date_str}&to={end_date_str}&apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                historical_data = data.get('historical', [])
-                if historical_data:
-                    prices_df = pd.DataFrame(historical_data)
-                    prices_df = standardize_ohlcv_dataframe(prices_df)
-                    prices_df['date'] = pd.to_datetime(prices_df['date'])
-                    prices_df.set_index('date', inplace=True)
-                    prices_df.sort_values(by=['date'], ascending=True, inplace=True)
-
-                    if cache_data is True:
-                        os.makedirs(cache_dir, exist_ok=True)
-                        prices_df.to_csv(path)
-                    return prices_df
+            url = _HISTORICAL_PRICES_URL.format(symbol=symbol)
+            fetched_dfs = {}
+            for fetch_start_str, fetch_end_str in date_ranges:
+                params = {'from': fetch_start_str, 'to': fetch_end_str}
+                if stream:
+                    prices_df = self._stream_records_to_frame(url, params=params, prefix='historical.item')
+                    prices_df = self._standardize_daily_prices(prices_df) if not prices_df.empty else None
                 else:
-                    return None
-            else:
-                print(f"Failed to fetch prices. Error: {response.reason}")
+                    prices_df = self._parse_daily_prices(self._cached_get(url, params=params))
+                if prices_df is not None:
+                    fetched_dfs[(fetch_start_str, fetch_end_str)] = prices_df
+
+            return self._merge_daily_prices(cached_df, fetched_dfs, symbol, start_date_str, end_date_str, cache_data, cache_dir)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
+            return _EMPTY_OHLCV.copy()
+
+    def _merge_daily_prices(self, cached_df: Union[pd.DataFrame, None], fetched_dfs: dict, symbol: str, start_date_str: str,
+                            end_date_str: str, cache_data: bool, cache_dir: str) -> pd.DataFrame:
+        """
+        Combines the fetched daily prices of a symbol with its cached prices and returns the requested date range.
+
+        fetched_dfs maps each fetched (start_date_str, end_date_str) range that returned prices to its DataFrame.
+        """
+        if cache_data is not True:
+            return self._slice_daily_prices(next(iter(fetched_dfs.values()), None), start_date_str, end_date_str)
+        prices_df = self._update_daily_prices_cache(cached_df, fetched_dfs, symbol, cache_dir)
+        return self._slice_daily_prices(prices_df, start_date_str, end_date_str)
+
+    def _read_daily_prices_cache(self, symbol: str, start_date_str: str, end_date_str: str, cache_dir: str) -> Union[pd.DataFrame, None]:
+        """
+        Loads the cached daily prices of a symbol.
+
+        The cache holds one file per symbol covering a contiguous date range, stored in the 'start_date' and 'end_date'
+        attrs. A file without that range is ignored and replaced by the next fetch. Per-range Parquet and CSV caches
+        written by earlier versions are converted, and removed, when the same range is requested.
+
+        Returns:
+            pd.DataFrame: The cached daily prices or None if nothing is cached.
+        """
+        prices_df = _read_cache(os.path.join(cache_dir, f"{symbol}-prices.parquet"))
+        if prices_df is not None:
+            if 'start_date' in prices_df.attrs and 'end_date' in prices_df.attrs:
+                return prices_df
+            logger.warning("Ignoring daily price cache of %s without a covered date range", symbol)
+
+        legacy_base_path = os.path.join(cache_dir, f"{symbol}-{start_date_str}-{end_date_str}-prices")
+        legacy_path = f"{legacy_base_path}.parquet"
+        prices_df = _read_cache(legacy_path)
+        if prices_df is None:
+            legacy_path = f"{legacy_base_path}.csv"
+            try:
+                prices_df = pd.read_csv(legacy_path, memory_map=True, index_col='date', parse_dates=['date'], date_format='ISO8601')
+            except FileNotFoundError:
                 return None
-        except Exception as ex:
-            print(ex)
+
+        # The legacy file can only cover the days that were complete when it was written
+        written_date = pd.Timestamp.fromtimestamp(os.path.getmtime(legacy_path)).normalize() - pd.Timedelta(days=1)
+        covered_end = min(pd.Timestamp(end_date_str), written_date)
+        prices_df.attrs = {'start_date': start_date_str, 'end_date': covered_end.strftime('%Y-%m-%d')}
+        self._write_daily_prices_cache(prices_df, symbol, cache_dir)
+        try:
+            os.remove(legacy_path)
+        except OSError as ex:
+            logger.warning("Failed to remove converted cache file %s: %s", legacy_path, ex)
+        return prices_df
+
+    def _write_daily_prices_cache(self, prices_df: pd.DataFrame, symbol: str, cache_dir: str):
+        """
+        Atomically replaces the cached daily prices of a symbol.
+        """
+        _write_cache(prices_df, os.path.join(cache_dir, f"{symbol}-prices.parquet"))
+
+    def _update_daily_prices_cache(self, cached_df: Union[pd.DataFrame, None], fetched_dfs: dict, symbol: str,
+                                   cache_dir: str) -> Union[pd.DataFrame, None]:
+        """
+        Merges newly fetched daily prices into the cached prices of a symbol and extends the covered date range.
+
+        The covered range is only extended over the fetched ranges that returned prices. An empty or failed response
+        leaves the cache untouched, so the range is fetched again by the next call.
+
+        Returns:
+            pd.DataFrame: The merged daily prices or None if there are none.
+        """
+        if not fetched_dfs:
+            return cached_df
+
+        prices_dfs = list(fetched_dfs.values()) if cached_df is None else [cached_df, *fetched_dfs.values()]
+        prices_df = pd.concat(prices_dfs) if len(prices_dfs) > 1 else prices_dfs[0]
+        prices_df = prices_df[~prices_df.index.duplicated(keep='last')].sort_index()
+
+        # Missing ranges adjoin the cached range, so the covered range stays contiguous. Days from today on may still
+        # change, so they are never marked as covered
+        last_complete_day = pd.Timestamp.today().normalize() - pd.Timedelta(days=1)
+        covered_ranges = [(pd.Timestamp(fetch_start_str), min(pd.Timestamp(fetch_end_str), last_complete_day))
+                          for fetch_start_str, fetch_end_str in fetched_dfs]
+        if cached_df is not None:
+            covered_ranges.append((pd.Timestamp(cached_df.attrs['start_date']), pd.Timestamp(cached_df.attrs['end_date'])))
+        covered_start = min(range_start for range_start, _ in covered_ranges)
+        covered_end = max(range_end for _, range_end in covered_ranges)
+        prices_df.attrs = {'start_date': covered_start.strftime('%Y-%m-%d'), 'end_date': covered_end.strftime('%Y-%m-%d')}
+
+        self._write_daily_prices_cache(prices_df, symbol, cache_dir)
+        return prices_df
+
+    @staticmethod
+    def _get_missing_date_ranges(cached_df: Union[pd.DataFrame, None], start_date_str: str, end_date_str: str) -> list:
+        """
+        Determines the date ranges that have to be fetched to extend the cached prices over the requested range.
+
+        Missing ranges reach up to the cached range, so the cache always covers one contiguous period.
+
+        Returns:
+            list: (start_date_str, end_date_str) tuples, empty when the cache covers the requested range.
+        """
+        if cached_df is None:
+            return [(start_date_str, end_date_str)]
+
+        one_day = pd.Timedelta(days=1)
+        covered_start = pd.Timestamp(cached_df.attrs['start_date'])
+        covered_end = pd.Timestamp(cached_df.attrs['end_date'])
+        date_ranges = []
+        if pd.Timestamp(start_date_str) < covered_start:
+            date_ranges.append((start_date_str, (covered_start - one_day).strftime('%Y-%m-%d')))
+        if pd.Timestamp(end_date_str) > covered_end:
+            date_ranges.append(((covered_end + one_day).strftime('%Y-%m-%d'), end_date_str))
+        return date_ranges
+
+    def _slice_daily_prices(self, prices_df: Union[pd.DataFrame, None], start_date_str: str, end_date_str: str) -> pd.DataFrame:
+        if prices_df is None:
+            return self._apply_float_dtype(_EMPTY_OHLCV.copy())
+        prices_df = prices_df.loc[start_date_str:end_date_str]
+        # Don't leak the cache bookkeeping to callers
+        prices_df.attrs = {}
+        return self._apply_float_dtype(prices_df)
+
+    def _apply_float_dtype(self, df: Union[pd.DataFrame, None]) -> Union[pd.DataFrame, None]:
+        """
+        Casts the float64 columns of a returned DataFrame to the loader's float_dtype.
+        """
+        if df is None or self._float_dtype == 'float64':
+            return df
+        float_columns = df.columns[df.dtypes == np.float64]
+        return df.astype(dict.fromkeys(float_columns, self._float_dtype)) if len(float_columns) else df
+
+    @staticmethod
+    def _parse_daily_prices(data: dict) -> Union[pd.DataFrame, None]:
+        """
+        Builds the daily prices DataFrame from a historical-price-full response.
+
+        Parameters:
+            data (dict): Decoded API response.
+
+        Returns:
+            pd.DataFrame: DataFrame with daily prices indexed by date or None if the response holds no prices.
+        """
+        historical_data = data.get('historical', [])
+        if not historical_data:
             return None
 
-    def fetch_multiple_daily_prices_by_date(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool = False, cache_dir: str = "cache") -> dict:
+        return FmpDataLoader._standardize_daily_prices(_records_to_frame(historical_data, _PRICE_FLOAT_FIELDS))
+
+    @staticmethod
+    def _standardize_daily_prices(prices_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts a frame of FMP price records into the standardized daily prices DataFrame indexed by date.
+        """
+        # Whole-number prices decode as ints, keep the price columns float64 whatever the first values were
+        prices_df = prices_df.astype({field: np.float64 for field in _PRICE_FLOAT_FIELDS if field in prices_df.columns})
+        # FMP dates are plain ISO dates, an explicit format skips per-row format inference. Malformed dates become NaT
+        # and their rows are dropped with the other incomplete rows below
+        prices_df['date'] = pd.to_datetime(prices_df['date'], format='%Y-%m-%d', cache=True, errors='coerce')
+        # Same result as standardize_ohlcv_dataframe for the known FMP fields: lower case names and no incomplete rows.
+        # JSON has no infinities and the types are already set, so its other passes are skipped.
+        prices_df = prices_df.rename(columns=lambda column: _PRICE_COLUMN_NAMES.get(column, column.lower()))
+        prices_df.dropna(inplace=True)
+        prices_df.set_index('date', inplace=True)
+        # FMP returns the newest day first, reversing is cheaper than sorting
+        if prices_df.index.is_monotonic_decreasing:
+            return prices_df.iloc[::-1]
+        prices_df.sort_index(inplace=True)
+        return prices_df
+
+    def fetch_multiple_daily_prices_by_date(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool = False, cache_dir: str = "cache",
+                                            max_workers: int = None, symbols_per_request: int = 1,
+                                            output_format: str = "dict") -> Union[dict, pd.DataFrame]:
         """
         Fetches daily prices by date for multiple symbols from the FMP API.
 
+        The requests are network bound, so they are issued concurrently from a thread pool sharing the loader's session.
+
         Parameters:
             symbol_list (list): List of stock symbols.
             start_date_str (str): Start date in 'YYYY-MM-DD' format.
             end_date_str (str): End date in 'YYYY-MM-DD' format.
             cache_data (bool): Flag to specify if data should be cached
             cache_dir (str): Directory to cache the data.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
+            symbols_per_request (int): Number of symbols requested together through the comma separated multi-ticker
+                endpoint, FMP accepts up to 5.
+            output_format (str): 'dict' for one DataFrame per symbol, 'long' for one DataFrame indexed by symbol and
+                date, 'wide' for one DataFrame indexed by date with (field, symbol) columns.
 
         Returns:
-            dict: A dictionary with symbols as keys and DataFrames with daily prices as values.
+            dict | pd.DataFrame: The daily prices in the requested output format.
         """
+        results = self._fetch_multiple_daily_prices(symbol_list, start_date_str, end_date_str, cache_data, cache_dir, max_workers,
+                                                    symbols_per_request)
+        return _combine_symbol_frames(results, output_format)
+
+    def _fetch_multiple_daily_prices(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool, cache_dir: str,
+                                     max_workers: int, symbols_per_request: int) -> dict:
+        logger.info("Now fetching price data for %d symbols...", len(symbol_list))
+        if symbols_per_request <= 1:
+            return self._fetch_multiple(lambda symbol: self.fetch_daily_prices_by_date(symbol, start_date_str, end_date_str, cache_data, cache_dir),
+                                        symbol_list, max_workers)
+
+        # Symbols missing the same date ranges are fetched together, each symbol once
+        symbol_list = list(dict.fromkeys(symbol_list))
+        cached_dfs = {}
+        symbol_groups = {}
+        for symbol in symbol_list:
+            cached_df = None
+            if cache_data is True:
+                cached_df = self._read_daily_prices_cache(symbol, start_date_str, end_date_str, cache_dir)
+            cached_dfs[symbol] = cached_df
+            date_ranges = tuple(self._get_missing_date_ranges(cached_df, start_date_str, end_date_str))
+            symbol_groups.setdefault(date_ranges, []).append(symbol)
+
+        batches = [(group[i:i + symbols_per_request], date_ranges)
+                   for date_ranges, group in symbol_groups.items() if date_ranges
+                   for i in range(0, len(group), symbols_per_request)]
+        fetched = {}
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(max_workers or self._max_workers, len(batches))) as executor:
+                futures = {executor.submit(self._fetch_daily_prices_batch, *batch): batch[0] for batch in batches}
+                for future in as_completed(futures):
+                    try:
+                        fetched.update(future.result())
+                    except Exception as ex:
+                        # A failing batch only loses its own symbols
+                        logger.warning("Failed to fetch data for %s: %s", ','.join(futures[future]), ex)
+
+        cached_symbols = set(symbol_groups.get((), []))
         results = {}
         for symbol in symbol_list:
-            print(f"Now fetching price data for {symbol}...")
-            df = self.fetch_daily_prices_by_date(symbol, start_date_str, end_date_str, cache_data, cache_dir)
-            if df is not None:
+            if symbol in fetched:
+                df = self._merge_daily_prices(cached_dfs[symbol], fetched[symbol], symbol, start_date_str, end_date_str, cache_data, cache_dir)
+            elif symbol in cached_symbols:
+                df = self._slice_daily_prices(cached_dfs[symbol], start_date_str, end_date_str)
+            else:
+                df = None
+            if df is not None and not df.empty:
                 results[symbol] = df
             else:
-                print(f"Failed to fetch data for {symbol}")
+                logger.warning("Failed to fetch data for %s", symbol)
         return results
 
-    def fetch_historical_dividends(self, symbol: str) -> pd.DataFrame:
+    def _fetch_daily_prices_batch(self, symbols: list, date_ranges: tuple) -> dict:
+        """
+        Fetches the daily prices of several symbols with one request per date range.
+
+        Parameters:
+            symbols (list): Stock symbols.
+            date_ranges (tuple): (start_date_str, end_date_str) tuples to fetch.
+
+        Returns:
+            dict: Symbols as keys and dicts mapping the fetched date ranges to their DataFrames as values. Symbols the
+                response holds no prices for are left out, the result is empty if a request failed.
+        """
+        try:
+            url = _HISTORICAL_PRICES_URL.format(symbol=','.join(symbols))
+            fetched = {}
+            for fetch_start_str, fetch_end_str in date_ranges:
+                data = self._cached_get(url, params={'from': fetch_start_str, 'to': fetch_end_str})
+                # Responses for a single symbol are not wrapped in a list
+                for stock_data in data.get('historicalStockList', [data]):
+                    prices_df = self._parse_daily_prices(stock_data)
+                    if prices_df is not None and stock_data.get('symbol') in symbols:
+                        fetched.setdefault(stock_data['symbol'], {})[(fetch_start_str, fetch_end_str)] = prices_df
+            return fetched
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
+            return {}
+
+    def _fetch_multiple(self, fetch_fn, symbol_list: list, max_workers: int = None) -> dict:
+        """
+        Calls a per-symbol fetch method concurrently from a thread pool sharing the loader's session.
+
+        Parameters:
+            fetch_fn (Callable): Function taking a symbol and returning a DataFrame, None or an empty DataFrame.
+            symbol_list (list): List of stock symbols.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
+
+        Returns:
+            dict: A dictionary with symbols as keys and the fetched DataFrames as values, in symbol_list order.
+        """
+        if not symbol_list:
+            return {}
+        if max_workers is None:
+            max_workers = self._max_workers
+        # Each symbol is fetched once, duplicates would race on the same cache files
+        symbol_list = list(dict.fromkeys(symbol_list))
+
+        dfs = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbol_list))) as executor:
+            futures = {executor.submit(fetch_fn, symbol): symbol for symbol in symbol_list}
+            for future in as_completed(futures):
+                try:
+                    dfs[futures[future]] = future.result()
+                except Exception as ex:
+                    # A failing symbol must not take the results of the others with it
+                    logger.warning("Failed to fetch data for %s: %s", futures[future], ex)
+        return self._collect_results(symbol_list, [dfs.get(symbol) for symbol in symbol_list])
+
+    @staticmethod
+    def _collect_results(symbol_list: list, dfs) -> dict:
+        """
+        Pairs per-symbol results with their symbols and leaves out the symbols without data.
+        """
+        results = {}
+        for symbol, df in zip(symbol_list, dfs):
+            if df is not None and not df.empty:
+                results[symbol] = df
+            else:
+                logger.warning("Failed to fetch data for %s", symbol)
+        return results
+
+    async def fetch_multiple_daily_prices_by_date_async(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool = False,
+                                                        cache_dir: str = "cache", max_connections: int = 100,
+                                                        output_format: str = "dict") -> Union[dict, pd.DataFrame]:
+        """
+        Fetches daily prices by date for multiple symbols from the FMP API using asyncio.
+
+        All requests share one httpx client, which multiplexes them over a single HTTP/2 connection when the h2 package
+        is installed. Requires the optional httpx dependency. Unlike the sync methods, requests always go to the network
+        and bypass the loader's response and memory caches, the per-symbol Parquet cache (cache_data) is used as usual.
+
+        Parameters:
+            symbol_list (list): List of stock symbols.
+            start_date_str (str): Start date in 'YYYY-MM-DD' format.
+            end_date_str (str): End date in 'YYYY-MM-DD' format.
+            cache_data (bool): Flag to specify if data should be cached
+            cache_dir (str): Directory to cache the data.
+            max_connections (int): Maximum number of concurrent connections.
+            output_format (str): 'dict' for one DataFrame per symbol, 'long' for one DataFrame indexed by symbol and
+                date, 'wide' for one DataFrame indexed by date with (field, symbol) columns.
+
+        Returns:
+            dict | pd.DataFrame: The daily prices in the requested output format.
+        """
+        symbol_list = list(dict.fromkeys(symbol_list))
+        async with self._async_client(max_connections) as client:
+            dfs = await asyncio.gather(*(self._fetch_daily_prices_async(client, symbol, start_date_str, end_date_str, cache_data, cache_dir)
+                                         for symbol in symbol_list))
+        return _combine_symbol_frames(self._collect_results(symbol_list, dfs), output_format)
+
+    def _async_client(self, max_connections: int):
+        """
+        Creates the httpx client shared by the requests of one async fetch, using HTTP/2 when the h2 package is installed.
+
+        Parameters:
+            max_connections (int): Maximum number of concurrent connections.
+
+        Returns:
+            httpx.AsyncClient: The client, to be used as an async context manager.
+        """
+        if httpx is None:
+            raise Exception("httpx is required for async fetching. Install it with 'pip install httpx[http2]'.")
+
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=20)
+        timeout = httpx.Timeout(_REQUEST_TIMEOUT[1], connect=_REQUEST_TIMEOUT[0])
+        http2 = importlib.util.find_spec('h2') is not None
+        return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout, params={'apikey': self._api_key})
+
+    async def _fetch_multiple_async(self, symbol_list: list, url_template: str, parse_fn, max_connections: int) -> dict:
+        """
+        Fetches one endpoint for multiple symbols concurrently on a shared httpx client.
+
+        Parameters:
+            symbol_list (list): List of stock symbols.
+            url_template (str): Endpoint URL with a {symbol} placeholder.
+            parse_fn (Callable): Function turning a decoded response into a DataFrame or None.
+            max_connections (int): Maximum number of concurrent connections.
+
+        Returns:
+            dict: A dictionary with symbols as keys and the parsed DataFrames as values, in symbol_list order.
+        """
+        async def fetch(client, symbol):
+            try:
+                response = await client.get(url_template.format(symbol=symbol))
+                response.raise_for_status()
+                return parse_fn(orjson.loads(response.content))
+            except (httpx.HTTPError,) + _FETCH_ERRORS as ex:
+                logger.warning("FMP request failed: %s", ex)
+                return None
+
+        async with self._async_client(max_connections) as client:
+            dfs = await asyncio.gather(*(fetch(client, symbol) for symbol in symbol_list))
+        return self._collect_results(symbol_list, dfs)
+
+    async def _fetch_daily_prices_async(self, client, symbol: str, start_date_str: str, end_date_str: str, cache_data: bool,
+                                        cache_dir: str) -> pd.DataFrame:
+        # Parquet cache IO is blocking, it runs in worker threads so it doesn't stall the other requests on the event loop
+        cached_df = None
+        if cache_data is True:
+            cached_df = await asyncio.to_thread(self._read_daily_prices_cache, symbol, start_date_str, end_date_str, cache_dir)
+        date_ranges = self._get_missing_date_ranges(cached_df, start_date_str, end_date_str)
+        if not date_ranges:
+            return self._slice_daily_prices(cached_df, start_date_str, end_date_str)
+
+        try:
+            url = _HISTORICAL_PRICES_URL.format(symbol=symbol)
+            fetched_dfs = {}
+            for fetch_start_str, fetch_end_str in date_ranges:
+                response = await client.get(url, params={'from': fetch_start_str, 'to': fetch_end_str})
+                response.raise_for_status()
+                prices_df = self._parse_daily_prices(orjson.loads(response.content))
+                if prices_df is not None:
+                    fetched_dfs[(fetch_start_str, fetch_end_str)] = prices_df
+
+            return await asyncio.to_thread(self._merge_daily_prices, cached_df, fetched_dfs, symbol, start_date_str, end_date_str,
+                                           cache_data, cache_dir)
+        except (httpx.HTTPError,) + _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
+            return _EMPTY_OHLCV.copy()
+
+    def fetch_historical_dividends(self, symbol: str, memory_cache_ttl: int = 300) -> pd.DataFrame:
         """
         Fetches historical dividends for a stock from the FMP API.
 
         Parameters:
             symbol (str): Stock symbol.
+            memory_cache_ttl (int): Seconds identical calls are served from memory, 0 always fetches.
 
         Returns:
             pd.DataFrame: DataFrame with historical dividends data.
         """
         try:
-            url = f"https://financialmodelingprep.com/api/v3/historical-price-full/stock_dividend/{symbol}?apikey={self._api_key}"
-            response = requests.get(url)
-
-            if response.status_code == 200:
-                data = response.json()
-                historical_data = data.get('historical', [])
-                if historical_data:
-                    dividends_df = pd.DataFrame(historical_data)
-                    dividends_df['payment_date'] = pd.to_datetime(dividends_df['paymentDate'])
-                    dividends_df['declaration_date'] = pd.to_datetime(dividends_df['declarationDate'])
-                    dividends_df.set_index('payment_date', inplace=True)
-                    return dividends_df
-                else:
-                    return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
+            data = self._cached_get(_HISTORICAL_DIVIDENDS_URL.format(symbol=symbol), memory_ttl=memory_cache_ttl)
+            return self._parse_historical_dividends(data)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
+            return None
+
+    @staticmethod
+    def _parse_historical_dividends(data: dict) -> Union[pd.DataFrame, None]:
+        """
+        Builds the dividends DataFrame indexed by payment date from a stock_dividend response, None if it holds no dividends.
+        """
+        historical_data = data.get('historical', [])
+        if not historical_data:
             return None
 
-    def fetch_multiple_historical_dividends(self, symbol_list: list, cache_data: bool = False, cache_dir: str = "cache") -> dict:
+        dividends_df = _records_to_frame(historical_data, _DIVIDEND_FLOAT_FIELDS)
+        dividends_df['payment_date'] = pd.to_datetime(dividends_df['paymentDate'], format='%Y-%m-%d', cache=True)
+        dividends_df['declaration_date'] = pd.to_datetime(dividends_df['declarationDate'], format='%Y-%m-%d', cache=True)
+        dividends_df.set_index('payment_date', inplace=True)
+        return dividends_df
+
+    def fetch_multiple_historical_dividends(self, symbol_list: list, cache_data: bool = False, cache_dir: str = "cache",
+                                           max_workers: int = None) -> dict:
         """
         Fetches multiple historic dividends for a list of symbols from FMP API.
 
         Parameters:
             symbol_list (list): List of stock symbols.
-            cache_data (bool): Flag to specify if data should be cached
-            cache_dir (str): Directory to cache the data.
+            cache_data (bool): Not used, dividends are served from the response cache
+            cache_dir (str): Not used, dividends are served from the response cache
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with daily prices as values.
         """
-        results = {}
-        for symbol in symbol_list:
-            print(f"Fetching historicsl for {symbol}...")
-            df = self.fetch_historical_dividends(symbol, cache_data, cache_dir)
-            if df is not None:
-                results[symbol] = df
-            else:
-                print(f"Failed to fetch data for {symbol}")
-        return results
+        logger.info("Now fetching historical dividends for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(self.fetch_historical_dividends, symbol_list, max_workers)
+
+    async def fetch_multiple_historical_dividends_async(self, symbol_list: list, max_connections: int = 100) -> dict:
+        """
+        Fetches historical dividends for multiple symbols from the FMP API using asyncio. Requires the optional httpx
+        dependency. Unlike the sync methods, requests always go to the network and bypass the loader's response and
+        memory caches.
+
+        Parameters:
+            symbol_list (list): List of stock symbols.
+            max_connections (int): Maximum number of concurrent connections.
+
+        Returns:
+            dict: A dictionary with symbols as keys and DataFrames with historical dividends as values.
+        """
+        return await self._fetch_multiple_async(symbol_list, _HISTORICAL_DIVIDENDS_URL, self._parse_historical_dividends, max_connections)
 
     def fetch_historical_splits(self, symbol: str) -> pd.DataFrame:
         """
@@ -299,45 +1163,94 @@ class FmpDataLoader:
             pd.DataFrame: DataFrame with historical stock splits data.
         """
         try:
-            url = f"https://financialmodelingprep.com/api/v3/historical-price-full/stock_split/{symbol}?apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                historical_data = data.get('historical', [])
-                if historical_data:
-                    splits_df = pd.DataFrame(historical_data)
-                    splits_df['date'] = pd.to_datetime(splits_df['date'])
-                    splits_df.set_index('date', inplace=True)
-                    return splits_df
-                else:
-                    return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
+            data = self._cached_get(_HISTORICAL_SPLITS_URL.format(symbol=symbol))
+            return self._parse_historical_splits(data)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
-    def fetch_multiple_historical_splits(self, symbol_list: list, cache_data: bool = False, cache_dir: str = "cache") -> dict:
+    @staticmethod
+    def _parse_historical_splits(data: dict) -> Union[pd.DataFrame, None]:
+        """
+        Builds the splits DataFrame indexed by date from a stock_split response, None if it holds no splits.
+        """
+        historical_data = data.get('historical', [])
+        if not historical_data:
+            return None
+
+        splits_df = pd.DataFrame(historical_data)
+        splits_df['date'] = pd.to_datetime(splits_df['date'], format='%Y-%m-%d', cache=True)
+        splits_df.set_index('date', inplace=True)
+        return splits_df
+
+    def fetch_multiple_historical_splits(self, symbol_list: list, cache_data: bool = False, cache_dir: str = "cache",
+                                        max_workers: int = None) -> dict:
         """
         Fetches multiple historical stock splits for a list of symbols from FMP API.
 
         Parameters:
             symbol_list (list): List of stock symbols.
-            cache_data (bool): Flag to specify if data should be cached.
-            cache_dir (str): Directory to cache the data.
+            cache_data (bool): Not used, splits are served from the response cache.
+            cache_dir (str): Not used, splits are served from the response cache.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with stock splits data as values.
         """
-        results = {}
-        for symbol in symbol_list:
-            print(f"Fetching historical splits for {symbol}...")
-            df = self.fetch_historical_splits(symbol, cache_data, cache_dir)
-            if df is not None:
-                results[symbol] = df
-            else:
-                print(f"Failed to fetch data for {symbol}")
-        return results
+        logger.info("Now fetching historical splits for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(self.fetch_historical_splits, symbol_list, max_workers)
+
+    async def fetch_multiple_historical_splits_async(self, symbol_list: list, max_connections: int = 100) -> dict:
+        """
+        Fetches historical stock splits for multiple symbols from the FMP API using asyncio. Requires the optional httpx
+        dependency. Unlike the sync methods, requests always go to the network and bypass the loader's response and
+        memory caches.
+
+        Parameters:
+            symbol_list (list): List of stock symbols.
+            max_connections (int): Maximum number of concurrent connections.
+
+        Returns:
+            dict: A dictionary with symbols as keys and DataFrames with stock splits data as values.
+        """
+        return await self._fetch_multiple_async(symbol_list, _HISTORICAL_SPLITS_URL, self._parse_historical_splits, max_connections)
+
+    def _get_df(self, url: str, params: dict = None, ttl: int = None, memory_ttl: int = None, columns: list = None,
+                float_fields: frozenset = frozenset(), date_field: str = None, date_format: str = '%Y-%m-%d',
+                category_fields: tuple = ()) -> Union[pd.DataFrame, None]:
+        """
+        Fetches an endpoint that returns a list of records and builds a DataFrame from it.
+
+        Parameters:
+            url (str): Request URL.
+            params (dict): Query parameters.
+            ttl (int): Response cache TTL in seconds, see _cached_get.
+            memory_ttl (int): In-memory cache TTL in seconds, see _cached_get.
+            columns (list): Fields to keep, None keeps all fields.
+            float_fields (frozenset): Field names stored as float64.
+            date_field (str): Field parsed as datetime, records with an invalid date are dropped.
+            date_format (str): Format of date_field.
+            category_fields (tuple): Fields stored as categories.
+
+        Returns:
+            pd.DataFrame: The records as a DataFrame, or None if there are none or the request fails.
+        """
+        try:
+            data = self._cached_get(url, params=params, ttl=ttl, memory_ttl=memory_ttl)
+            if not data:
+                return None
+
+            df = _records_to_frame(_project_records(data, columns, required=(date_field,) if date_field else ()), float_fields)
+            if date_field is not None:
+                df[date_field] = pd.to_datetime(df[date_field], format=date_format, cache=True, errors='coerce')
+                # Filter out invalid dates (NaT values after conversion)
+                df = df.dropna(subset=[date_field])
+            if category_fields:
+                df = _to_categories(df, category_fields)
+            return self._apply_float_dtype(df)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
+            return None
 
     def fetch_tradable_list(self):
         """
@@ -346,272 +1259,158 @@ class FmpDataLoader:
         Returns:
         - pd.DataFrame: DataFrame containing the tradable securities data, or None if no data is found.
         """
-        try:
-            url = f"https://financialmodelingprep.com/api/v3/available-traded/list?apikey={self._api_key}"
-            response = requests.get(url)
-    
-            if response.status_code == 200:
-                securities_data = response.json()
-                if securities_data:
-                    securities_df = pd.DataFrame(securities_data)
-                    return securities_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
+        return self._get_df(_TRADABLE_LIST_URL)
     
     
-    def get_analyst_ratings(self, symbol):
+    def get_analyst_ratings(self, symbol, columns=None):
         """
         Get analyst ratings for a given stock symbol.
     
         Parameters:
         - symbol (str): Stock symbol.
+        - columns (list): Fields to keep, None keeps all fields.
     
         Returns:
         - pd.DataFrame: DataFrame containing the analyst ratings data, or None if no data is found.
         """
-        try:
-            url = f"https://financialmodelingprep.com/api/v3/grade/{symbol}?apikey={self._api_key}"
-            response = requests.get(url)
+        return self._get_df(_GRADE_URL.format(symbol=symbol), columns=columns, date_field='date', category_fields=_GRADE_CATEGORY_FIELDS)
     
-            if response.status_code == 200:
-                grades_data = response.json()
-                if grades_data:
-                    grades_df = pd.DataFrame(grades_data)
-                    grades_df['date'] = pd.to_datetime(grades_df['date'], errors='coerce')
-                    # Filter out invalid dates (NaT values after conversion)
-                    grades_df = grades_df.dropna(subset=['date'])
     
-                    return grades_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
-    
-    
-    def get_income_growth(self, symbol, period='annual'):
+    def get_income_growth(self, symbol, period='annual', columns=None):
         """
         Get income growth data for a given stock symbol.
     
         Parameters:
         - symbol (str): Stock symbol.
         - period (str): Reporting period, either 'annual' or 'quarterly' (default: 'annual').
+        - columns (list): Fields to keep, None keeps all fields.
     
         Returns:
         - pd.DataFrame: DataFrame containing the income growth data, or None if no data is found.
         """
-        try: 
-            url = f"https://financialmodelingprep.com/api/v3/income-statement-growth/{symbol}?period={period}&apikey={self._api_key}"
-            response = requests.get(url)
-    
-            if response.status_code == 200:
-                growth_data = response.json()
-                if growth_data:
-                    growth_df = pd.DataFrame(growth_data)
-                    return growth_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
+        return self._get_df(_INCOME_GROWTH_URL.format(symbol=symbol), params={'period': period}, columns=columns)
 
-    def get_financial_ratios(self, symbol, period):
+    def get_financial_ratios(self, symbol, period, columns=None):
         """
         Get financial ratios for a given stock symbol.
     
         Parameters:
         - symbol (str): Stock symbol.
         - period (str): Reporting period, either 'annual' or 'quarterly'.
+        - columns (list): Fields to keep, None keeps all fields.
     
         Returns:
         - pd.DataFrame: DataFrame containing the financial ratios data, or None if no data is found.
         """
-        try:
-            url = f"https://financialmodelingprep.com/api/v3/ratios/{symbol}?period={period}&apikey={self._api_key}"
-            response = requests.get(url)
-    
-            if response.status_code == 200:
-                ratios_data = response.json()
-                if ratios_data:
-                    ratios_df = pd.DataFrame(ratios_data)
-                    return ratios_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
+        return self._get_df(_RATIOS_URL.format(symbol=symbol), params={'period': period}, columns=columns)
     
-    def get_social_sentiment(self, symbol):
+    def get_social_sentiment(self, symbol, columns=None):
         """
         Get social sentiment data for a given stock symbol.
     
         Parameters:
         - symbol (str): Stock symbol.
+        - columns (list): Fields to keep, None keeps all fields.
     
         Returns:
         - pd.DataFrame: DataFrame containing the social sentiment data, or None if no data is found.
         """
-        try:
-            url = f"https://financialmodelingprep.com/api/v4/historical/social-sentiment?symbol={symbol}&apikey={self._api_key}"
-            response = requests.get(url)
-    
-            if response.status_code == 200:
-                social_sentiment_data = response.json()
-                if social_sentiment_data:
-                    social_sentiment_df = pd.DataFrame(social_sentiment_data)
-                    social_sentiment_df['date'] = pd.to_datetime(social_sentiment_df['date'], errors='coerce')
-                    # Filter out invalid dates (NaT values after conversion)
-                    social_sentiment_df = social_sentiment_df.dropna(subset=['date'])
-    
-                    return social_sentiment_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
+        return self._get_df(_SOCIAL_SENTIMENT_URL, params={'symbol': symbol}, ttl=min(self._response_cache_ttl, _NEWS_CACHE_TTL),
+                            columns=columns, date_field='date', date_format='ISO8601')
 
-    def get_stock_news(self, symbol, limit):
+    def get_stock_news(self, symbol, limit, columns=None):
         """
         Get the latest stock news for a given stock symbol.
     
         Parameters:
         - symbol (str): Stock symbol.
         - limit (int): Number of news articles to fetch.
+        - columns (list): Fields to keep, None keeps all fields.
     
         Returns:
         - pd.DataFrame: DataFrame containing the news articles, or None if no data is found.
         """
-        try:
-            url = f"https://financialmodelingprep.com/api/v3/stock_news?tickers={symbol}&limit={limit}&apikey={self._api_key}"
-            response = requests.get(url)
-    
-            if response.status_code == 200:
-                news_data = response.json()
-                if news_data:
-                    news_df = pd.DataFrame(news_data)
-                    news_df['publishedDate'] = pd.to_datetime(news_df['publishedDate'], errors='coerce')
-                    # Filter out invalid dates (NaT values after conversion)
-                    news_df = news_df.dropna(subset=['publishedDate'])
-    
-                    return news_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
-            return None
+        return self._get_df(_STOCK_NEWS_URL, params={'tickers': symbol, 'limit': limit}, ttl=min(self._response_cache_ttl, _NEWS_CACHE_TTL),
+                            columns=columns, date_field='publishedDate', date_format='ISO8601', category_fields=_NEWS_CATEGORY_FIELDS)
 
-    def fetch_all_prices(self):
+    def fetch_all_prices(self, stream: bool = False):
         """
         Fetch real-time prices for all stocks.
     
+        Parameters:
+        - stream (bool): Parse the response incrementally with ijson, which avoids holding the raw response, the decoded
+          list of quotes and the DataFrame in memory at the same time. Requires the optional ijson dependency.
+
         Returns:
         - pd.DataFrame: DataFrame containing real-time price data for all stocks, or None if no data is found.
         """
+        # Real-time quotes must never be served from the response cache
+        if not stream:
+            return self._get_df(_REAL_TIME_PRICES_URL, ttl=0, memory_ttl=0, float_fields=_REAL_TIME_PRICE_FLOAT_FIELDS)
+
         try:
-            url = f"https://financialmodelingprep.com/api/v3/stock/full/real-time-price?apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    all_prices_df = pd.DataFrame(data)
-                    return all_prices_df
-                else:
-                    return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
+            all_prices_df = self._stream_records_to_frame(_REAL_TIME_PRICES_URL, float_fields=_REAL_TIME_PRICE_FLOAT_FIELDS)
+            return self._apply_float_dtype(all_prices_df) if not all_prices_df.empty else None
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
     def fetch_institutional_ownership_changes(self, symbol, include_current_quarter=True):
         try:
-            url = f"https://financialmodelingprep.com/api/v4/institutional-ownership/symbol-ownership?symbol={symbol}&includeCurrentQuarter={str(include_current_quarter)}&apikey={self._api_key}"
-            response = requests.get(url)
-
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    inst_own_df = pd.DataFrame(data)
-
-                    # Sort by date
-                    inst_own_df['date'] = pd.to_datetime(inst_own_df['date'], errors='coerce')
-                    inst_own_df.sort_values(by=['date'], ascending=False, inplace=True)
-
-                    # Calculate total invested percent change
-                    if len(inst_own_df) > 0:
-                        latest_total_invested = inst_own_df['totalInvested'].iloc[0]
-                        previous_total_invested = inst_own_df['lastTotalInvested'].iloc[0]
-                        if previous_total_invested > 0:
-                            total_invested_percent_change = round(
-                                ((latest_total_invested - previous_total_invested) / previous_total_invested), 2)
-                        else:
-                            total_invested_percent_change = 0
-
-                        # Calculate investors holding change
-                        latest_investors_holding = inst_own_df['investorsHolding'].iloc[0]
-                        previous_investors_holding = inst_own_df['lastInvestorsHolding'].iloc[0]
-                        if previous_investors_holding > 0:
-                            investors_holding_change = round(
-                                ((latest_investors_holding - previous_investors_holding) / previous_investors_holding), 2)
-                        else:
-                            investors_holding_change = 0
-                    else:
-                        total_invested_percent_change = 0
-                        investors_holding_change = 0
-                    inst_own_df['totalInvestedChange'] = total_invested_percent_change
-                    inst_own_df['investorsHoldingChange'] = investors_holding_change
-
-                    return inst_own_df
-                return None
-            else:
-                return None
-        except Exception as ex:
-            print(ex)
+            params = {'symbol': symbol, 'includeCurrentQuarter': str(include_current_quarter)}
+            data = self._cached_get(_INSTITUTIONAL_OWNERSHIP_URL, params=params)
+            if data:
+                inst_own_df = pd.DataFrame(data)
+
+                # Sort by date
+                inst_own_df['date'] = pd.to_datetime(inst_own_df['date'], format='%Y-%m-%d', cache=True, errors='coerce')
+                inst_own_df.sort_values(by=['date'], ascending=False, inplace=True)
+
+                # Percent changes of the latest quarter, read from the first row once
+                total_invested_percent_change = 0
+                investors_holding_change = 0
+                if len(inst_own_df) > 0:
+                    latest = inst_own_df.iloc[0]
+                    if latest['lastTotalInvested'] > 0:
+                        total_invested_percent_change = round(
+                            (latest['totalInvested'] - latest['lastTotalInvested']) / latest['lastTotalInvested'], 2)
+                    if latest['lastInvestorsHolding'] > 0:
+                        investors_holding_change = round(
+                            (latest['investorsHolding'] - latest['lastInvestorsHolding']) / latest['lastInvestorsHolding'], 2)
+                inst_own_df['totalInvestedChange'] = total_invested_percent_change
+                inst_own_df['investorsHoldingChange'] = investors_holding_change
+
+                return inst_own_df
+            return None
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
-    def fetch_multiple_institutional_ownership_changes(self, symbol_list: list, include_current_quarter: bool = True) -> dict:
+    def fetch_multiple_institutional_ownership_changes(self, symbol_list: list, include_current_quarter: bool = True,
+                                                       max_workers: int = None) -> dict:
         """
         Fetches historical institutional ownership for multiple symbols from FMP API for a specific date.
 
         Parameters:
             symbol_list (list): List of stock symbols.
             include_current_quarter (str): include current quarter
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with institutional ownership data as values.
         """
-        results_dict = {}
-        for symbol in symbol_list:
-            df = self.fetch_institutional_ownership_changes(symbol, include_current_quarter)
-            if df is not None:
-                results_dict[symbol] = df
-            else:
-                print(f"Failed to fetch data for {symbol}")
-        return results_dict
-
-    def fetch_earnings_calendar(self, start_date_str, end_date_str):
-        url = f"https://financialmodelingprep.com/api/v3/earning_calendar?from={start_date_str}&to={end_date_str}&apikey={self._api_key}"
+        return self._fetch_multiple(lambda symbol: self.fetch_institutional_ownership_changes(symbol, include_current_quarter),
+                                    symbol_list, max_workers)
 
+    def fetch_earnings_calendar(self, start_date_str, end_date_str, memory_cache_ttl: int = 300):
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
+            params = {'from': start_date_str, 'to': end_date_str}
+            data = self._cached_get(_EARNINGS_CALENDAR_URL, params=params, memory_ttl=memory_cache_ttl)
 
-            # Create DataFrame from the data
-            df = pd.DataFrame(data)
-            return df
+            return _records_to_frame(data, _EARNINGS_FLOAT_FIELDS) if data else pd.DataFrame()
 
-        except requests.exceptions.RequestException as e:
-            print(f"An error occurred while fetching the earnings calendar: {e}")
+        except _FETCH_ERRORS as e:
+            logger.error("An error occurred while fetching the earnings calendar: %s", e)
             return pd.DataFrame()  # Return an empty DataFrame in case of error
 
     def fetch_insider_trades(self, symbol: str, from_date_str: str, to_date_str: str, cache_data: bool = False,
@@ -630,44 +1429,45 @@ class FmpDataLoader:
             pd.DataFrame: DataFrame with insider trades.
         """
 
-        file_name = f"{symbol}-insider-trades-{from_date_str}-to-{to_date_str}.csv"
-        path = os.path.join(cache_dir, file_name)
+        # The cache is stored as Parquet, a CSV file written by earlier versions is read once and converted
+        base_name = f"{symbol}-insider-trades-{from_date_str}-to-{to_date_str}"
+        path = os.path.join(cache_dir, f"{base_name}.parquet")
         if cache_data is True:
-            if os.path.exists(path) is True:
-                trades_df = pd.read_csv(path)
-                trades_df['transactionDate'] = pd.to_datetime(trades_df['transactionDate'])
-                trades_df.set_index('transactionDate', inplace=True)
-                trades_df = trades_df[(trades_df.index >= from_date_str) & (trades_df.index <= to_date_str)]
+            trades_df = _read_cache(path)
+            if trades_df is not None:
+                return trades_df
+            try:
+                trades_df = pd.read_csv(os.path.join(cache_dir, f"{base_name}.csv"), memory_map=True, index_col='transactionDate',
+                                        parse_dates=['transactionDate'], date_format='ISO8601')
+                trades_df = trades_df[trades_df.index.notna()].sort_index().loc[from_date_str:to_date_str]
+                _write_cache(trades_df, path)
                 return trades_df
+            except FileNotFoundError:
+                pass
 
         try:
-            url = f"https://financialmodelingprep.com/api/v4/insider-trading?symbol={symbol}&apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    trades_df = pd.DataFrame(data)
-                    trades_df['transactionDate'] = pd.to_datetime(trades_df['transactionDate'])
-                    trades_df.set_index('transactionDate', inplace=True)
-                    trades_df.sort_values(by=['transactionDate'], ascending=True, inplace=True)
-
-                    # Filter by date range
-                    trades_df = trades_df[(trades_df.index >= from_date_str) & (trades_df.index <= to_date_str)]
-
-                    if cache_data is True:
-                        os.makedirs(cache_dir, exist_ok=True)
-                        trades_df.to_csv(path)
-                    return trades_df
-                else:
-                    return None
+            data = self._cached_get(_INSIDER_TRADING_URL, params={'symbol': symbol})
+            if data:
+                trades_df = pd.DataFrame(data)
+                trades_df['transactionDate'] = pd.to_datetime(trades_df['transactionDate'], format='%Y-%m-%d', cache=True, errors='coerce')
+                trades_df.set_index('transactionDate', inplace=True)
+                # Trades without a transaction date can't be placed in the date range, and NaT would break the sorted slice
+                trades_df = trades_df[trades_df.index.notna()].sort_index()
+
+                # Filter by date range, slicing the sorted index only needs two binary searches
+                trades_df = trades_df.loc[from_date_str:to_date_str]
+
+                if cache_data is True:
+                    _write_cache(trades_df, path)
+                return trades_df
             else:
-                print(f"Failed to fetch insider trades. Error: {response.reason}")
                 return None
-        except Exception as ex:
-            print(ex)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
-    def fetch_multiple_insider_trades_by_date(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool = False, cache_dir: str = "cache") -> dict:
+    def fetch_multiple_insider_trades_by_date(self, symbol_list: list, start_date_str: str, end_date_str: str, cache_data: bool = False, cache_dir: str = "cache",
+                                              max_workers: int = None) -> dict:
         """
         Fetches daily prices by date for multiple insider trades from the FMP API.
 
@@ -677,19 +1477,14 @@ class FmpDataLoader:
             end_date_str (str): End date in 'YYYY-MM-DD' format.
             cache_data (bool): Flag to specify if data should be cached
             cache_dir (str): Directory to cache the data.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with daily prices as values.
         """
-        results = {}
-        for symbol in symbol_list:
-            print(f"Now fetching insider trades data for {symbol}...")
-            df = self.fetch_insider_trades(symbol, start_date_str, end_date_str, cache_data, cache_dir)
-            if df is not None:
-                results[symbol] = df
-            else:
-                print(f"Failed to fetch insider trades data for {symbol}")
-        return results
+        logger.info("Now fetching insider trades data for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(lambda symbol: self.fetch_insider_trades(symbol, start_date_str, end_date_str, cache_data, cache_dir),
+                                    symbol_list, max_workers)
 
     def fetch_analyst_earnings_estimates(self, symbol: str, period: str, limit: int=100) -> Union[pd.DataFrame, None]:
         """
@@ -705,45 +1500,33 @@ class FmpDataLoader:
             pd.DataFrame: DataFrame with analyst estimates data or None if the request fails.
         """
         try:
-            url = f"https://financialmodelingprep.com/api/v3/analyst-estimates/{symbol}?period={period}&limit={limit}&apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    estimates_df = pd.DataFrame(data)
-                    return estimates_df
-                else:
-                    print(f"No data found for {symbol}.")
-                    return None
+            data = self._cached_get(_ANALYST_ESTIMATES_URL.format(symbol=symbol), params={'period': period, 'limit': limit})
+            if data:
+                estimates_df = pd.DataFrame(data)
+                return self._apply_float_dtype(estimates_df)
             else:
-                print(f"Failed to fetch analyst estimates. Error: {response.reason}")
+                logger.warning("No data found for %s.", symbol)
                 return None
-        except Exception as ex:
-            print(ex)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
-    def fetch_multiple_analyst_earnings_estimates(self, symbol_list: list, period: str, limit=100) -> dict:
+    def fetch_multiple_analyst_earnings_estimates(self, symbol_list: list, period: str, limit=100, max_workers: int = None) -> dict:
         """
         Fetches analyst earnings estimates for multiple symbols from the FMP API.
 
         Parameters:
             symbol_list (list): List of stock symbols
             period (Period): Period for the estimates, either 'quarter' or 'annual'
-            cache_data (bool): Flag to specify if data should be cached
-            cache_dir (str): Directory to cache the data.
+            limit (int): Number of records to fetch per symbol.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with daily prices as values.
         """
-        results = {}
-        for symbol in symbol_list:
-            print(f"Now fetching earnings estimate data for {symbol}...")
-            df = self.fetch_analyst_earnings_estimates(symbol, period, limit)
-            if df is not None:
-                results[symbol] = df
-            else:
-                print(f"Failed to fetch data for {symbol}")
-        return results
+        logger.info("Now fetching earnings estimate data for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(lambda symbol: self.fetch_analyst_earnings_estimates(symbol, period, limit),
+                                    symbol_list, max_workers)
 
     def fetch_earnings_surprises(self, symbol: str) -> Union[pd.DataFrame, None]:
         """
@@ -756,26 +1539,20 @@ class FmpDataLoader:
             pd.DataFrame: DataFrame with earnings surprises data or None if the request fails.
         """
         try:
-            url = f"https://financialmodelingprep.com/api/v3/earnings-surprises/{symbol}?apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    surprises_df = pd.DataFrame(data)
-                    if len(surprises_df) > 0:
-                        # Convert date to pd format
-                        surprises_df['date'] = pd.to_datetime(surprises_df['date'])
-                        # Sort by date
-                        surprises_df.sort_values(by="date", ascending=True)
-                    return surprises_df
-                else:
-                    print(f"No data found for {symbol}.")
-                    return None
+            data = self._cached_get(_EARNINGS_SURPRISES_URL.format(symbol=symbol))
+            if data:
+                surprises_df = pd.DataFrame(data)
+                if len(surprises_df) > 0:
+                    # Convert date to pd format
+                    surprises_df['date'] = pd.to_datetime(surprises_df['date'], format='%Y-%m-%d', cache=True)
+                    # Sort by date
+                    surprises_df.sort_values(by="date", ascending=True, inplace=True)
+                return surprises_df
             else:
-                print(f"Failed to fetch earnings surprises. Error: {response.reason}")
+                logger.warning("No data found for %s.", symbol)
                 return None
-        except Exception as ex:
-            print(ex)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
     def fetch_price_targets(self, symbol: str, cache_data: bool = False,
@@ -792,39 +1569,38 @@ class FmpDataLoader:
             pd.DataFrame: DataFrame with price targets.
         """
 
-        file_name = f"{symbol}-price-targets.csv"
-        path = os.path.join(cache_dir, file_name)
+        # The cache is stored as Parquet, a CSV file written by earlier versions is read once and converted
+        path = os.path.join(cache_dir, f"{symbol}-price-targets.parquet")
         if cache_data is True:
-            if os.path.exists(path) is True:
-                price_targets_df = pd.read_csv(path)
-                price_targets_df['publishedDate'] = pd.to_datetime(price_targets_df['publishedDate'])
+            price_targets_df = _read_cache(path)
+            if price_targets_df is not None:
+                return price_targets_df
+            try:
+                price_targets_df = pd.read_csv(os.path.join(cache_dir, f"{symbol}-price-targets.csv"), memory_map=True, index_col=0,
+                                               parse_dates=['publishedDate'], date_format='ISO8601')
+                _write_cache(price_targets_df, path)
                 return price_targets_df
+            except FileNotFoundError:
+                pass
 
         try:
-            url = f"https://financialmodelingprep.com/api/v4/price-target?symbol={symbol}&apikey={self._api_key}"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    price_targets_df = pd.DataFrame(data)
-                    price_targets_df['publishedDate'] = pd.to_datetime(price_targets_df['publishedDate'])
-                    price_targets_df.sort_values(by=['publishedDate'], ascending=True, inplace=True)
-
-                    if cache_data is True:
-                        os.makedirs(cache_dir, exist_ok=True)
-                        price_targets_df.to_csv(path)
-                    return price_targets_df
-                else:
-                    return None
+            data = self._cached_get(_PRICE_TARGET_URL, params={'symbol': symbol})
+            if data:
+                price_targets_df = pd.DataFrame(data)
+                price_targets_df['publishedDate'] = pd.to_datetime(price_targets_df['publishedDate'], format='ISO8601', cache=True)
+                price_targets_df.sort_values(by=['publishedDate'], ascending=True, inplace=True)
+
+                if cache_data is True:
+                    _write_cache(price_targets_df, path)
+                return price_targets_df
             else:
-                print(f"Failed to fetch price targets. Error: {response.reason}")
                 return None
-        except Exception as ex:
-            print(ex)
+        except _FETCH_ERRORS as ex:
+            logger.warning("FMP request failed: %s", ex)
             return None
 
     def fetch_multiple_price_targets_by_date(self, symbol_list: list,
-                                             cache_data: bool = False, cache_dir: str = "cache") -> dict:
+                                             cache_data: bool = False, cache_dir: str = "cache", max_workers: int = None) -> dict:
         """
         Fetches price targets by date for multiple symbols from the FMP API.
 
@@ -832,16 +1608,10 @@ class FmpDataLoader:
             symbol_list (list): List of stock symbols.
             cache_data (bool): Flag to specify if data should be cached.
             cache_dir (str): Directory to cache the data.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
         Returns:
             dict: A dictionary with symbols as keys and DataFrames with price targets as values.
         """
-        results = {}
-        for symbol in symbol_list:
-            #print(f"Now fetching price target data for {symbol}...")
-            df = self.fetch_price_targets(symbol, cache_data, cache_dir)
-            if df is not None:
-                results[symbol] = df
-            else:
-                print(f"Failed to fetch price target data for {symbol}")
-        return results
+        logger.info("Now fetching price target data for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(lambda symbol: self.fetch_price_targets(symbol, cache_data, cache_dir), symbol_list, max_workers)
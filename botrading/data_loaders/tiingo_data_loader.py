@@ -1,12 +1,19 @@
 import os
+import logging
+import orjson
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from botrading.base.enums import TiingoDailyInterval, TiingoIntradayInterval, DataType
 from typing import List
 from botrading.utils.string_utils import clean_string, join_items
 
 
+logger = logging.getLogger(__name__)
+
+
 class TiingoDataLoader:
     """
     TiingoDataLoader provides methods to interact with Tiingo APIs to fetch data such as stock prices, crypto prices, news, and forex data.
@@ -15,14 +22,47 @@ class TiingoDataLoader:
         api_key (str): Tiingo API key.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_workers: int = 8):
         """
         Initializes the TiingoDataLoader with the given API key.
 
         Parameters:
             api_key (str): Tiingo API key.
+            max_workers (int): Default number of concurrent requests of the fetch_multiple_* methods.
         """
         self.api_key = api_key
+        self._max_workers = max_workers
+
+        # Reuse one session so keep-alive connections to the Tiingo host are shared across calls and worker threads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self._session.mount('https://', adapter)
+
+    def _fetch_multiple(self, fetch_fn, symbol_list: List[str], max_workers: int = None) -> dict:
+        """
+        Runs a per-symbol fetch function for multiple symbols on a thread pool.
+
+        Parameters:
+            fetch_fn (Callable): Function taking a symbol and returning its data.
+            symbol_list (List[str]): List of stock symbols.
+            max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
+
+        Returns:
+            dict: A dictionary with symbols as keys and the fetch results as values, in symbol_list order.
+        """
+        if not symbol_list:
+            return {}
+        max_workers = max_workers or self._max_workers
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbol_list))) as executor:
+            futures = {executor.submit(fetch_fn, symbol): symbol for symbol in symbol_list}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as ex:
+                    # A failing symbol must not take the results of the others with it
+                    logger.warning("Failed to fetch data for %s: %s", futures[future], ex)
+        return {symbol: results.get(symbol) for symbol in symbol_list}
 
     def fetch_intraday_prices(self, symbol: str, start_date_str: str, end_date_str: str, interval: TiingoIntradayInterval, cache_data=False, cache_dir="cache") -> pd.DataFrame:
         """
@@ -44,7 +84,7 @@ class TiingoDataLoader:
             path = os.path.join(cache_dir, file_name)
 
             if cache_data and os.path.exists(path):
-                prices_df = pd.read_csv(path, parse_dates=['date'])
+                prices_df = pd.read_csv(path, parse_dates=['date'], date_format='ISO8601')
                 prices_df.set_index('date', inplace=True)
                 prices_df.index.name = 'date'
                 return prices_df
@@ -52,13 +92,13 @@ class TiingoDataLoader:
                 fetch_url = f"https://api.tiingo.com/iex/{symbol}/prices?startDate={start_date_str}&endDate={end_date_str}&resampleFreq={interval.value}&columns=date,open,high,low,close,volume&token={self.api_key}"
                 headers = {'Accept': 'application/json'}
 
-                response = requests.get(fetch_url, headers=headers)
+                response = self._session.get(fetch_url, headers=headers)
                 response.raise_for_status()  # Raise an error for bad status codes
 
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 if not data:
-                    print("No data returned from Tiingo API.")
+                    logger.warning("No data returned from Tiingo API for %s.", symbol)
                     return None
 
                 prices_df = pd.DataFrame()
@@ -73,7 +113,7 @@ class TiingoDataLoader:
                     })
                     prices_df = pd.concat([prices_df, row_df], axis=0, ignore_index=True)
 
-                prices_df['date'] = pd.to_datetime(prices_df['date'])
+                prices_df['date'] = pd.to_datetime(prices_df['date'], format='ISO8601', cache=True)
 
                 if cache_data:
                     os.makedirs(cache_dir, exist_ok=True)
@@ -84,19 +124,15 @@ class TiingoDataLoader:
 
                 return prices_df
         except Exception as ex:
-            print(f"Failed to fetch Tiingo prices: {ex}")
+            logger.warning("Failed to fetch Tiingo prices: %s", ex)
             return None
 
-    def fetch_multiple_intraday_prices(self, symbol_list: List[str], start_date_str: str, end_date_str: str, interval: TiingoIntradayInterval, cache_data=False, cache_dir="cache") -> pd.DataFrame:
-        prices_dict = {}
-        for symbol in symbol_list:
-            print(f"Fetching prices for {symbol}")
-            # fetch prices
-            prices_df = self.fetch_intraday_prices(symbol, start_date_str, end_date_str,
-                                                                 interval, cache_data=cache_data,
-                                                                 cache_dir=cache_dir)
-            prices_dict[symbol] = prices_df
-        return prices_dict
+    def fetch_multiple_intraday_prices(self, symbol_list: List[str], start_date_str: str, end_date_str: str, interval: TiingoIntradayInterval, cache_data=False, cache_dir="cache",
+                                       max_workers: int = None) -> pd.DataFrame:
+        logger.info("Fetching intraday prices for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(lambda symbol: self.fetch_intraday_prices(symbol, start_date_str, end_date_str, interval,
+                                                                              cache_data=cache_data, cache_dir=cache_dir),
+                                    symbol_list, max_workers)
 
     def fetch_end_of_day_prices(self, symbol: str, start_date: str, end_date: str, interval: TiingoDailyInterval, cache_data = False, cache_dir: str = "cache") -> pd.DataFrame:
         """
@@ -117,7 +153,7 @@ class TiingoDataLoader:
             path = os.path.join(cache_dir, file_name)
 
             if cache_data is True and os.path.exists(path):
-                prices_df = pd.read_csv(path, parse_dates=['date'])
+                prices_df = pd.read_csv(path, parse_dates=['date'], date_format='ISO8601')
                 if 'date' in prices_df.columns:
                     prices_df.set_index('date', inplace=True)
                     prices_df.index.name = 'date'
@@ -126,8 +162,9 @@ class TiingoDataLoader:
                 fetch_url = f"https://api.tiingo.com/tiingo/daily/{symbol}/prices?startDate={start_date}&endDate={end_date}&resampleFreq={interval.value}&columns=date,open,high,low,close,volume&token={self.api_key}"
                 headers = {'Accept': 'application/json'}
 
-                response = requests.get(fetch_url, headers=headers)
-                data = response.json()
+                response = self._session.get(fetch_url, headers=headers)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
 
                 prices_df = pd.DataFrame(data)
                 prices_df.rename(columns={"adjClose": "adj_close"}, inplace=True)
@@ -154,10 +191,11 @@ class TiingoDataLoader:
 
                 return prices_df
         except Exception as ex:
-            print(f"Failed to fetch Tiingo prices: {ex}")
+            logger.warning("Failed to fetch Tiingo prices: %s", ex)
             return None
 
-    def fetch_multiple_end_of_day_prices(self, symbol_list: List[str], start_date_str: str, end_date_str: str, interval=TiingoDailyInterval.DAILY, cache_data=False, cache_dir="cache") -> pd.DataFrame:
+    def fetch_multiple_end_of_day_prices(self, symbol_list: List[str], start_date_str: str, end_date_str: str, interval=TiingoDailyInterval.DAILY, cache_data=False, cache_dir="cache",
+                                         max_workers: int = None) -> pd.DataFrame:
         """
          Fetches daily prices for multiple symbols.
 
@@ -168,17 +206,15 @@ class TiingoDataLoader:
          interval (TiingoDailyInterval): The interval, e.g. daily, weekly, monthly
          cache_data (bool): Flag to specify if data should be cached. Default is False.
          cache_dir (str): Directory to cache the data. Default is "cache".
+         max_workers (int): Maximum number of concurrent requests, defaults to the loader's max_workers.
 
          Returns:
          pd.DataFrame: DataFrame containing the daily prices for multiple symbols.
          """
-        prices_dict = {}
-        for symbol in symbol_list:
-            print(f"Fetching prices for {symbol}")
-            # fetch prices
-            prices_df = self.fetch_end_of_day_prices(symbol, start_date_str, end_date_str, interval, cache_data=cache_data, cache_dir=cache_dir)
-            prices_dict[symbol] = prices_df
-        return prices_dict
+        logger.info("Fetching end of day prices for %d symbols...", len(symbol_list))
+        return self._fetch_multiple(lambda symbol: self.fetch_end_of_day_prices(symbol, start_date_str, end_date_str, interval,
+                                                                                cache_data=cache_data, cache_dir=cache_dir),
+                                    symbol_list, max_workers)
 
     def fetch_news_article_by_symbol(self, symbol: str,
                                      start_date_str: str,
@@ -210,38 +246,38 @@ class TiingoDataLoader:
         }
 
         try:
-            response = requests.get(base_url, headers=headers, params=params, timeout=30)
-            if response.status_code == 200:
-                news_json = response.json()
-
-                # Convert to DataFrame
-                news_df = pd.DataFrame(news_json)
-                if not news_df.empty:
-                    news_df['title'] = news_df['title'].apply(clean_string)
-                    news_df['description'] = news_df['description'].apply(clean_string)
-                    news_df.rename(columns={'tickers': 'symbols'}, inplace=True)
-                    news_df['symbols'] = news_df['symbols'].apply(join_items)
-
-                    # Drop duplicate articles
-                    news_df = news_df.drop_duplicates(subset='title')
-                    news_df['id'] = news_df['id'].astype(str)
-
-                    # Cache news for review
-                    if cache_data is True:
-                        os.makedirs(cache_dir, exist_ok=True)
-                        if len(news_df) > 0:
-                            news_df.to_csv(path)
-
-                # Convert dates to pd dates
-                if len(news_df) > 0 and 'publishedDate' in news_df.columns:
-                    news_df['publishedDate'] = pd.to_datetime(news_df['publishedDate'], errors='coerce')
+            response = self._session.get(base_url, headers=headers, params=params, timeout=30)
+            response.raise_for_status()
+            news_json = orjson.loads(response.content)
+
+            # Convert to DataFrame
+            news_df = pd.DataFrame(news_json)
+            if not news_df.empty:
+                news_df['title'] = news_df['title'].apply(clean_string)
+                news_df['description'] = news_df['description'].apply(clean_string)
+                news_df.rename(columns={'tickers': 'symbols'}, inplace=True)
+                news_df['symbols'] = news_df['symbols'].apply(join_items)
+
+                # Drop duplicate articles
+                news_df = news_df.drop_duplicates(subset='title')
+                news_df['id'] = news_df['id'].astype(str)
+
+                # Cache news for review
+                if cache_data is True:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    if len(news_df) > 0:
+                        news_df.to_csv(path)
 
-                return news_df
-            else:
-                print(f"Error: Tiingo News API returned error HTTP status code: {response.status_code}")
-                return None
+            # Convert dates to pd dates
+            if len(news_df) > 0 and 'publishedDate' in news_df.columns:
+                news_df['publishedDate'] = pd.to_datetime(news_df['publishedDate'], format='ISO8601', cache=True, errors='coerce')
+
+            return news_df
+        except requests.HTTPError as ex:
+            logger.warning("Tiingo News API returned error HTTP status code: %s", ex.response.status_code)
+            return None
         except Exception as ex:
-            print(f"Error: Fetch news stories API failed with exception: {str(ex)}")
+            logger.warning("Fetch news stories API failed with exception: %s", ex)
             return None
 
     def fetch_multiple_news_articles(self, symbol_list: list[str],
@@ -250,7 +286,7 @@ class TiingoDataLoader:
                                      limit=50,
                                      cache_data: bool=False,
                                      cache_dir: str = 'cache'):
-        print(f"Fetching Tiingo news data....")
+        logger.info("Fetching Tiingo news data for %d symbols...", len(symbol_list))
         i = 1
         news_dict = {}
         for symbol in symbol_list:
@@ -2,16 +2,18 @@ import pandas as pd
 import numpy as np
 from sklearn.feature_selection import mutual_info_regression
 from sklearn.ensemble import RandomForestRegressor
-from scipy.stats import pearsonr
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 from sklearn.manifold import TSNE
 from ..utils.df_utils import check_ohlc_dataframe
 from ..feature_engineering.feature_generation import add_future_returns
-from sklearn.feature_selection import mutual_info_regression
 from statsmodels.tsa.stattools import coint
 
 
+# Raw OHLCV columns that are never scored as features
+_NON_FEATURE_COLUMNS = frozenset(['open', 'high', 'low', 'close', 'volume'])
+
+
 def calculate_mutual_information(df: pd.DataFrame, target_column: str) -> pd.DataFrame:
     """
     Calculates mutual information for each feature against future returns.
@@ -22,19 +24,18 @@ def calculate_mutual_information(df: pd.DataFrame, target_column: str) -> pd.Dat
     Returns:
         pd.DataFrame: Data frame with mutual information scores.
     """
-    _df = df.copy()
     # Check if target column exists
-    if target_column not in _df.columns:
+    if target_column not in df.columns:
         raise Exception(f"Target column {target_column} does not exist in dataframe!")
 
     target = df[target_column]
-    results = []
-    for feature in _df.columns:
-        if feature not in ['open', 'high', 'low', 'close', 'volume', target_column]:
-            mi_score = mutual_info_regression(_df[[feature]], target, discrete_features=False)[0]
-            results.append({'feature': feature, 'info_score': mi_score})
+    excluded_columns = _NON_FEATURE_COLUMNS | {target_column}
+    feature_columns = [feature for feature in df.columns if feature not in excluded_columns]
+
+    # Score all features in a single call - each column is still estimated independently against the target
+    mi_scores = mutual_info_regression(df[feature_columns], target, discrete_features=False)
 
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame({'feature': feature_columns, 'info_score': mi_scores})
     results_df.sort_values(by=['info_score'], ascending=[False], inplace=True)
 
     return results_df
@@ -53,29 +54,24 @@ def calculate_random_forest_importance(df: pd.DataFrame, target_column: str,
     Returns:
         pd.DataFrame: Data frame with random forest importance scores.
     """
-    _df = df.copy()
     # Check if target column exists
-    if target_column not in _df.columns:
+    if target_column not in df.columns:
         raise Exception(f"Target column {target_column} does not exist in dataframe!")
 
-    target = _df[target_column]
-    _df.drop(columns=target_column, inplace=True)
+    target = df[target_column]
     # Filter out columns that are not features
     #feature_columns = [col for col in df.columns if
     #                   col not in ['open', 'high', 'low', 'close', 'volume', target_column]]
-    feature_columns = _df.columns.tolist()
-    features = _df[feature_columns]
+    features = df.drop(columns=target_column)
+    feature_columns = features.columns.tolist()
 
-    # Fit the Random Forest model on all features
-    rf = RandomForestRegressor(n_estimators=num_estimators, random_state=42)
+    # Fit a single Random Forest model on all features, building trees on all cores
+    rf = RandomForestRegressor(n_estimators=num_estimators, random_state=42, n_jobs=-1)
     rf.fit(features, target)
 
     # Get feature importances
     feature_importances = rf.feature_importances_
-    results = [{'feature': feature, 'info_score': score} for feature, score in
-               zip(feature_columns, feature_importances)]
-
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame({'feature': feature_columns, 'info_score': feature_importances})
     results_df.sort_values(by=['info_score'], ascending=[False], inplace=True)
 
     return results_df
@@ -92,19 +88,26 @@ def calculate_pearson_correlation(df: pd.DataFrame, target_column: str) -> pd.Da
     Returns:
         pd.DataFrame: Data frame with Pearson correlation scores.
     """
-    _df = df.copy()
     # Check if target column exists
-    if target_column not in _df.columns:
+    if target_column not in df.columns:
         raise Exception(f"Target column {target_column} does not exist in dataframe!")
 
-    target = _df[target_column]
-    results = []
-    for feature in _df.columns:
-        if feature not in ['open', 'high', 'low', 'close', 'volume', target_column]:
-            corr, _ = pearsonr(_df[feature], target)
-            results.append({'feature': feature, 'info_score': corr})
+    # Correlation is undefined for fewer than two rows - bail out before building any matrices
+    if len(df) < 2:
+        raise Exception("Dataframe must have at least 2 rows to calculate Pearson correlation!")
+
+    excluded_columns = _NON_FEATURE_COLUMNS | {target_column}
+    feature_columns = [feature for feature in df.columns if feature not in excluded_columns]
+
+    # Center all features at once and correlate them against the target with a single matrix product
+    features = df[feature_columns].to_numpy(dtype=np.float64)
+    target = df[target_column].to_numpy(dtype=np.float64)
+    features = features - features.mean(axis=0)
+    target = target - target.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = (features.T @ target) / (np.sqrt((features * features).sum(axis=0)) * np.sqrt(target @ target))
 
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame({'feature': feature_columns, 'info_score': corr})
     results_df.sort_values(by=['info_score'], ascending=[False], inplace=True)
 
     return results_df
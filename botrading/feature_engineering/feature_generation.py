@@ -303,7 +303,9 @@ def add_future_returns(df: pd.DataFrame, lookahead_period: int, source_column='c
     Returns:
         pd.DataFrame: Data frame with added future return column.
     """
-    df[target_column] = df[source_column].pct_change(periods=lookahead_period).shift(-lookahead_period)
+    # Shift once and divide, instead of computing the backward pct_change and shifting it forward again
+    source = df[source_column]
+    df[target_column] = source.shift(-lookahead_period) / source - 1
     df.replace([np.inf, -np.inf], np.nan, inplace=True)
     df.dropna(inplace=True)
     return df
@@ -15,7 +15,9 @@ setup(
         'lxml>=5.2.2',
         'numpy>=1.26.4',
         'pandas>=2.2.2',
+        'pyarrow>=14.0.0',
         'requests>=2.31.0',
+        'orjson>=3.9.0',
         'pytz>=2024.1',
         'matplotlib>=3.7.5,<3.8.0',
         'seaborn>=0.13.2',
@@ -30,6 +32,10 @@ setup(
         'TA-Lib>=0.4.19',
         'mplfinance>=0.12.10b0'
     ],
+    extras_require={
+        'async': ['httpx[http2]>=0.27.0'],
+        'stream': ['ijson>=3.1']
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
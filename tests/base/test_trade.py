@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from botrading.base.enums import OrderSide, OrderType, OrderStatus
+from botrading.base.order import Order
+from botrading.base.trade import Trade, _is_missing
+
+
+class TestTrade(unittest.TestCase):
+
+    def setUp(self):
+        self.open_order = Order(id='order-1', client_order_id='client-1', created_at=datetime(2024, 1, 2, 9, 30),
+                                side=OrderSide.BUY, order_type=OrderType.LIMIT, symbol='AAPL', quantity=10.0,
+                                status=OrderStatus.FILLED, filled_quantity=10.0, filled_avg_price=185.5, limit_price=186.0)
+
+    def test_dict_round_trip(self):
+        trade = Trade(trade_id='trade-1', order=self.open_order)
+
+        trade_dict = trade.to_dict()
+        restored = Trade.from_dict(trade_dict)
+
+        self.assertEqual(restored.open_order.created_at, datetime(2024, 1, 2, 9, 30))
+        self.assertEqual(restored.open_order.side, OrderSide.BUY)
+        self.assertIsNone(restored.close_order)
+        self.assertEqual(restored.to_dict(), trade_dict)
+
+    def test_flat_row_without_close_order(self):
+        row = pd.Series({'trade_id': 'trade-1', 'open_order_id': 'order-1', 'open_side': 'buy', 'open_order_type': 'limit',
+                         'open_symbol': 'AAPL', 'open_quantity': 10.0, 'open_status': 'filled',
+                         'close_order_id': pd.NA, 'is_closed': False})
+
+        trade = Trade.from_dict(row.to_dict())
+
+        self.assertEqual(trade.open_order.id, 'order-1')
+        self.assertIsNone(trade.close_order)
+
+    def test_is_missing(self):
+        for value in (None, '', np.nan, float('nan'), pd.NA, pd.NaT):
+            self.assertTrue(_is_missing(value), repr(value))
+        for value in ('order-1', 0, 0.0, pd.Timestamp('2024-01-02')):
+            self.assertFalse(_is_missing(value), repr(value))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,505 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import orjson
+import numpy as np
+import pandas as pd
+import requests
+from botrading.data_loaders import fmp_data_loader
+from botrading.data_loaders.fmp_data_loader import FmpDataLoader, _records_to_frame
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def price_history(start_date_str, end_date_str, symbol='A'):
+    # FMP returns the most recent day first
+    dates = pd.bdate_range(start_date_str, end_date_str)[::-1]
+    return {'symbol': symbol,
+            'historical': [{'date': date.strftime('%Y-%m-%d'), 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5,
+                            'adjClose': 1.5, 'volume': 100} for date in dates]}
+
+
+def fake_price_get(url, params=None, **kwargs):
+    return price_history(params['from'], params['to'], symbol=url.rsplit('/', 1)[-1])
+
+
+def make_response(status_code=200, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.raw = io.BytesIO(content)
+    response.headers.update(headers or {})
+    response.url = 'https://financialmodelingprep.com/api/v3/test'
+    return response
+
+
+PRICE_TARGETS = [{'symbol': 'A', 'publishedDate': '2024-01-02T10:00:00.000Z', 'priceTarget': 10.0},
+                 {'symbol': 'A', 'publishedDate': '2024-01-01T10:00:00.000Z', 'priceTarget': 9.0}]
+
+
+class TestRecordsToFrame(unittest.TestCase):
+
+    def test_float_fields(self):
+        records = [{'symbol': 'A', 'price': 1.5}, {'symbol': 'B', 'price': None}]
+        df = _records_to_frame(records, frozenset(['price']))
+
+        self.assertEqual(df['price'].dtype, np.float64)
+        self.assertTrue(np.isnan(df['price'].iloc[1]))
+
+    def test_different_fields_are_kept(self):
+        records = [{'a': 1, 'b': 2.0}, {'a': 3, 'c': 4}]
+        df = _records_to_frame(records, frozenset(['b']))
+
+        self.assertEqual(list(df.columns), ['a', 'b', 'c'])
+        self.assertEqual(df['c'].iloc[1], 4)
+
+    def test_non_numeric_float_values_become_nan(self):
+        records = [{'symbol': 'A', 'price': ''}, {'symbol': 'B', 'price': '2.5'}]
+        df = _records_to_frame(records, frozenset(['price']))
+
+        self.assertEqual(df['price'].dtype, np.float64)
+        self.assertTrue(np.isnan(df['price'].iloc[0]))
+        self.assertEqual(df['price'].iloc[1], 2.5)
+
+
+class TestParseDailyPrices(unittest.TestCase):
+
+    def test_standardized_frame(self):
+        prices_df = FmpDataLoader._parse_daily_prices(price_history('2020-01-01', '2020-01-10'))
+
+        self.assertEqual(list(prices_df.columns), ['open', 'high', 'low', 'close', 'adj_close', 'volume'])
+        self.assertEqual(prices_df['open'].dtype, np.float64)
+        self.assertTrue(prices_df.index.is_monotonic_increasing)
+
+    def test_malformed_date_drops_row(self):
+        data = price_history('2020-01-01', '2020-01-10')
+        data['historical'][0]['date'] = '2020/01/10'
+
+        prices_df = FmpDataLoader._parse_daily_prices(data)
+
+        self.assertEqual(len(prices_df), 7)
+        self.assertEqual(prices_df.index[-1], pd.Timestamp('2020-01-09'))
+
+
+class TestFetchMultiple(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key', max_workers=4)
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_failing_symbol_does_not_abort_batch(self):
+        def fetch(symbol):
+            if symbol == 'BAD':
+                raise PermissionError("cache not writable")
+            return pd.DataFrame({'close': [1.0]})
+
+        with self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            results = self.loader._fetch_multiple(fetch, ['A', 'BAD', 'C'])
+
+        self.assertEqual(list(results), ['A', 'C'])
+
+    def test_empty_results_are_skipped(self):
+        with self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            results = self.loader._fetch_multiple(lambda symbol: None if symbol == 'B' else pd.DataFrame({'close': [1.0]}),
+                                                  ['A', 'B'])
+
+        self.assertEqual(list(results), ['A'])
+
+
+class TestCacheErrors(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_unreadable_cache_file_is_refetched(self):
+        with open(os.path.join(self.cache_dir, 'A-price-targets.parquet'), 'wb') as file:
+            file.write(b'not parquet')
+
+        with patch.object(self.loader, '_cached_get', return_value=PRICE_TARGETS), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            price_targets_df = self.loader.fetch_price_targets('A', cache_data=True, cache_dir=self.cache_dir)
+
+        self.assertEqual(list(price_targets_df['priceTarget']), [9.0, 10.0])
+
+    def test_failed_cache_write_still_returns_data(self):
+        with patch.object(self.loader, '_cached_get', return_value=PRICE_TARGETS), \
+                patch('pandas.DataFrame.to_parquet', side_effect=PermissionError("read-only")), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            price_targets_df = self.loader.fetch_price_targets('A', cache_data=True, cache_dir=self.cache_dir)
+
+        self.assertEqual(len(price_targets_df), 2)
+
+
+class TestDailyPricesCache(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_superset_range_merge(self):
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get:
+            self.loader.fetch_daily_prices_by_date('A', '2020-01-01', '2020-01-10', cache_data=True, cache_dir=self.cache_dir)
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-06', '2020-01-20', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+
+        # Only the days after the cached range are fetched the second time
+        self.assertEqual(mock_get.call_args.kwargs['params'], {'from': '2020-01-11', 'to': '2020-01-20'})
+        self.assertEqual(prices_df.index[0], pd.Timestamp('2020-01-06'))
+        self.assertEqual(prices_df.index[-1], pd.Timestamp('2020-01-20'))
+        self.assertTrue(prices_df.index.is_monotonic_increasing)
+
+        cached_df = pd.read_parquet(os.path.join(self.cache_dir, 'A-prices.parquet'))
+        self.assertEqual(cached_df.attrs, {'start_date': '2020-01-01', 'end_date': '2020-01-20'})
+
+        # A covered range is served from the cache
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get:
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-02', '2020-01-15', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+        mock_get.assert_not_called()
+        self.assertEqual(len(prices_df), 10)
+
+    def test_empty_response_does_not_extend_cache(self):
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get):
+            self.loader.fetch_daily_prices_by_date('A', '2024-01-01', '2024-01-31', cache_data=True, cache_dir=self.cache_dir)
+        with patch.object(self.loader, '_cached_get', return_value={}):
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2024-01-01', '2024-06-30', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+
+        self.assertEqual(prices_df.index[-1], pd.Timestamp('2024-01-31'))
+        cached_df = pd.read_parquet(os.path.join(self.cache_dir, 'A-prices.parquet'))
+        self.assertEqual(cached_df.attrs, {'start_date': '2024-01-01', 'end_date': '2024-01-31'})
+
+        # The range without prices is requested again
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get:
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2024-01-01', '2024-06-30', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+        self.assertEqual(mock_get.call_args.kwargs['params'], {'from': '2024-02-01', 'to': '2024-06-30'})
+        self.assertEqual(prices_df.index[-1], pd.Timestamp('2024-06-28'))
+
+    def test_cache_without_range_is_refetched(self):
+        pd.DataFrame({'close': [1.0]}, index=pd.DatetimeIndex(['2020-01-02'], name='date')).to_parquet(
+            os.path.join(self.cache_dir, 'A-prices.parquet'))
+
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get, \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-01', '2020-01-10', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+
+        mock_get.assert_called_once()
+        self.assertEqual(len(prices_df), 8)
+
+    def test_per_range_parquet_cache_is_converted(self):
+        legacy_path = os.path.join(self.cache_dir, 'A-2020-01-01-2020-01-10-prices.parquet')
+        legacy_df = FmpDataLoader._parse_daily_prices(price_history('2020-01-01', '2020-01-10'))
+        legacy_df.to_parquet(legacy_path)
+
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get:
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-01', '2020-01-10', cache_data=True,
+                                                               cache_dir=self.cache_dir)
+
+        mock_get.assert_not_called()
+        self.assertEqual(len(prices_df), 8)
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, 'A-prices.parquet')))
+
+    def test_duplicate_symbols_are_fetched_once(self):
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get) as mock_get:
+            prices_dict = self.loader.fetch_multiple_daily_prices_by_date(['A', 'A', 'B'], '2020-01-01', '2020-01-10',
+                                                                          cache_data=True, cache_dir=self.cache_dir)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(list(prices_dict), ['A', 'B'])
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['A-prices.parquet', 'B-prices.parquet'])
+
+
+class TestInsiderTrades(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_trades_without_date_are_dropped(self):
+        trades = [{'symbol': 'A', 'transactionDate': date, 'securitiesTransacted': i}
+                  for i, date in enumerate(['2024-01-05', '', '2023-12-31', '2024-01-02', '2024-02-01'])]
+
+        with patch.object(self.loader, '_cached_get', return_value=trades):
+            trades_df = self.loader.fetch_insider_trades('A', '2024-01-01', '2024-01-31')
+
+        self.assertEqual(list(trades_df['securitiesTransacted']), [3, 0])
+
+
+class TestEarningsSurprises(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_surprises_are_sorted_by_date(self):
+        surprises = [{'symbol': 'A', 'date': date, 'actualEarningResult': i}
+                     for i, date in enumerate(['2024-04-25', '2023-10-26', '2024-01-25'])]
+
+        with patch.object(self.loader, '_cached_get', return_value=surprises):
+            surprises_df = self.loader.fetch_earnings_surprises('A')
+
+        self.assertEqual(list(surprises_df['actualEarningResult']), [1, 2, 0])
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncFetching(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+        self.cache_dir = tempfile.mkdtemp()
+        self.requests = []
+
+    def tearDown(self):
+        self.loader.close()
+
+    def handle_request(self, request):
+        self.requests.append(request.url)
+        symbol = request.url.path.rsplit('/', 1)[-1]
+        if symbol == 'BAD':
+            return httpx.Response(404)
+        if 'stock_dividend' in request.url.path:
+            return httpx.Response(200, json={'symbol': symbol, 'historical': [
+                {'date': '2024-01-02', 'dividend': 0.2, 'paymentDate': '2024-01-10', 'declarationDate': '2023-12-01'}]})
+        return httpx.Response(200, json=price_history(request.url.params['from'], request.url.params['to'], symbol))
+
+    def mock_client(self, max_connections):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle_request), params={'apikey': 'test-key'})
+
+    async def test_daily_prices_with_failing_symbol(self):
+        with patch.object(self.loader, '_async_client', self.mock_client), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            prices_dict = await self.loader.fetch_multiple_daily_prices_by_date_async(['A', 'BAD', 'C'], '2020-01-01', '2020-01-10',
+                                                                                      cache_data=True, cache_dir=self.cache_dir)
+
+        self.assertEqual(list(prices_dict), ['A', 'C'])
+        self.assertEqual(len(prices_dict['A']), 8)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['A-prices.parquet', 'C-prices.parquet'])
+
+        # The second call is served from the Parquet cache
+        self.requests.clear()
+        with patch.object(self.loader, '_async_client', self.mock_client):
+            prices_dict = await self.loader.fetch_multiple_daily_prices_by_date_async(['A', 'C'], '2020-01-02', '2020-01-09',
+                                                                                      cache_data=True, cache_dir=self.cache_dir)
+        self.assertEqual(self.requests, [])
+        self.assertEqual(len(prices_dict['C']), 6)
+
+    async def test_dividends(self):
+        with patch.object(self.loader, '_async_client', self.mock_client), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            dividends_dict = await self.loader.fetch_multiple_historical_dividends_async(['A', 'BAD'])
+
+        self.assertEqual(list(dividends_dict), ['A'])
+        self.assertEqual(dividends_dict['A'].index[0], pd.Timestamp('2024-01-10'))
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.loader = FmpDataLoader('test-key', response_cache_dir=self.cache_dir, response_cache_ttl=60)
+        self.url = 'https://financialmodelingprep.com/api/v3/test'
+
+    def tearDown(self):
+        self.loader.close()
+
+    def expire_cache(self):
+        for file_name in os.listdir(self.cache_dir):
+            os.utime(os.path.join(self.cache_dir, file_name), (0, 0))
+
+    def test_hit_and_miss(self):
+        with patch.object(self.loader._session, 'get', return_value=make_response(content=b'[{"a": 1}]')) as mock_get:
+            self.assertEqual(self.loader._cached_get(self.url, params={'symbol': 'A'}), [{'a': 1}])
+            self.assertEqual(self.loader._cached_get(self.url, params={'symbol': 'A'}), [{'a': 1}])
+            self.assertEqual(mock_get.call_count, 1)
+
+            # Different parameters are a different cache entry
+            self.loader._cached_get(self.url, params={'symbol': 'B'})
+            self.assertEqual(mock_get.call_count, 2)
+
+            # A TTL of 0 bypasses the cache
+            self.loader._cached_get(self.url, params={'symbol': 'A'}, ttl=0)
+            self.assertEqual(mock_get.call_count, 3)
+
+    def test_expired_response_is_revalidated(self):
+        first = make_response(content=b'[1]', headers={'ETag': '"v1"', 'Last-Modified': 'Tue, 02 Jan 2024 10:00:00 GMT'})
+        with patch.object(self.loader._session, 'get', return_value=first):
+            self.loader._cached_get(self.url)
+        self.expire_cache()
+
+        with patch.object(self.loader._session, 'get', return_value=make_response(status_code=304)) as mock_get:
+            self.assertEqual(self.loader._cached_get(self.url), [1])
+        self.assertEqual(mock_get.call_args.kwargs['headers'],
+                         {'If-None-Match': '"v1"', 'If-Modified-Since': 'Tue, 02 Jan 2024 10:00:00 GMT'})
+
+        # The 304 refreshed the cached response for another TTL
+        with patch.object(self.loader._session, 'get') as mock_get:
+            self.assertEqual(self.loader._cached_get(self.url), [1])
+        mock_get.assert_not_called()
+
+    def test_changed_response_replaces_cache(self):
+        with patch.object(self.loader._session, 'get', return_value=make_response(content=b'[1]', headers={'ETag': '"v1"'})):
+            self.loader._cached_get(self.url)
+        self.expire_cache()
+
+        with patch.object(self.loader._session, 'get', return_value=make_response(content=b'[2]')):
+            self.assertEqual(self.loader._cached_get(self.url), [2])
+        # Without an ETag in the new response the old validators are dropped
+        self.assertFalse(any(file_name.endswith('.meta') for file_name in os.listdir(self.cache_dir)))
+
+    def test_memory_cache_lru_eviction(self):
+        with patch.object(fmp_data_loader, '_MEMORY_CACHE_SIZE', 2), \
+                patch.object(self.loader, '_disk_cached_get', side_effect=lambda url, params, ttl: params['symbol']) as mock_get:
+            for symbol in ('A', 'B', 'A', 'C'):
+                self.loader._cached_get(self.url, params={'symbol': symbol}, memory_ttl=60)
+            self.assertEqual(mock_get.call_count, 3)
+
+            # B was the least recently used entry and got evicted, A is still cached
+            self.loader._cached_get(self.url, params={'symbol': 'A'}, memory_ttl=60)
+            self.assertEqual(mock_get.call_count, 3)
+            self.loader._cached_get(self.url, params={'symbol': 'B'}, memory_ttl=60)
+            self.assertEqual(mock_get.call_count, 4)
+
+
+class TestBatchedDailyPrices(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+
+    def tearDown(self):
+        self.loader.close()
+
+    @staticmethod
+    def fake_batch_get(url, params=None, **kwargs):
+        symbols = url.rsplit('/', 1)[-1].split(',')
+        if 'BAD' in symbols:
+            raise requests.ConnectionError("connection reset")
+        if len(symbols) == 1:
+            return price_history(params['from'], params['to'], symbols[0])
+        return {'historicalStockList': [price_history(params['from'], params['to'], symbol) for symbol in symbols]}
+
+    def test_multi_ticker_batch(self):
+        with patch.object(self.loader, '_cached_get', side_effect=self.fake_batch_get) as mock_get:
+            prices_dict = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B', 'C'], '2020-01-01', '2020-01-10',
+                                                                          symbols_per_request=2)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(list(prices_dict), ['A', 'B', 'C'])
+        self.assertTrue(all(len(prices_df) == 8 for prices_df in prices_dict.values()))
+
+    def test_batch_with_failing_symbol(self):
+        with patch.object(self.loader, '_cached_get', side_effect=self.fake_batch_get), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            prices_dict = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B', 'BAD', 'C'], '2020-01-01', '2020-01-10',
+                                                                          symbols_per_request=2)
+
+        # Only the batch with the failing symbol is lost
+        self.assertEqual(list(prices_dict), ['A', 'B'])
+
+    def test_symbol_missing_from_batch_response_keeps_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        with patch.object(self.loader, '_cached_get', side_effect=self.fake_batch_get):
+            self.loader.fetch_multiple_daily_prices_by_date(['A', 'B'], '2024-01-01', '2024-01-31', cache_data=True,
+                                                            cache_dir=cache_dir, symbols_per_request=2)
+
+        def fake_partial_get(url, params=None, **kwargs):
+            return {'historicalStockList': [price_history(params['from'], params['to'], 'A')]}
+
+        with patch.object(self.loader, '_cached_get', side_effect=fake_partial_get), \
+                self.assertLogs('botrading.data_loaders.fmp_data_loader', level='WARNING'):
+            prices_dict = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B'], '2024-01-01', '2024-02-28', cache_data=True,
+                                                                          cache_dir=cache_dir, symbols_per_request=2)
+
+        self.assertEqual(list(prices_dict), ['A'])
+        cached_df = pd.read_parquet(os.path.join(cache_dir, 'B-prices.parquet'))
+        self.assertEqual(cached_df.attrs, {'start_date': '2024-01-01', 'end_date': '2024-01-31'})
+
+        # The missing symbol is requested again
+        with patch.object(self.loader, '_cached_get', side_effect=self.fake_batch_get) as mock_get:
+            prices_dict = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B'], '2024-01-01', '2024-02-28', cache_data=True,
+                                                                          cache_dir=cache_dir, symbols_per_request=2)
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args.kwargs['params'], {'from': '2024-02-01', 'to': '2024-02-28'})
+        self.assertEqual(prices_dict['B'].index[-1], pd.Timestamp('2024-02-28'))
+
+    def test_output_formats(self):
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get):
+            long_df = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B'], '2020-01-01', '2020-01-10', output_format='long')
+            wide_df = self.loader.fetch_multiple_daily_prices_by_date(['A', 'B'], '2020-01-01', '2020-01-10', output_format='wide')
+
+        self.assertEqual(long_df.index.names, ['symbol', 'date'])
+        self.assertEqual(len(long_df), 16)
+        self.assertEqual(wide_df.shape, (8, 12))
+        self.assertEqual(wide_df[('close', 'B')].iloc[0], 1.5)
+
+        with patch.object(self.loader, '_cached_get', side_effect=fake_price_get), self.assertRaises(ValueError):
+            self.loader.fetch_multiple_daily_prices_by_date(['A'], '2020-01-01', '2020-01-10', output_format='other')
+
+
+@unittest.skipIf(ijson is None, "ijson is not installed")
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = FmpDataLoader('test-key')
+
+    def tearDown(self):
+        self.loader.close()
+
+    def test_streamed_prices_match(self):
+        content = orjson.dumps(price_history('2020-01-01', '2020-03-31'))
+        with patch.object(self.loader._session, 'get', side_effect=lambda *args, **kwargs: make_response(content=content)):
+            prices_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-01', '2020-03-31')
+            streamed_df = self.loader.fetch_daily_prices_by_date('A', '2020-01-01', '2020-03-31', stream=True)
+
+        pd.testing.assert_frame_equal(prices_df, streamed_df)
+
+    def test_streamed_screener_and_all_prices_match(self):
+        quotes = [{'symbol': 'A', 'bidPrice': 1.5, 'askPrice': 1.6, 'volume': 100, 'fmpLast': None},
+                  {'symbol': 'B', 'bidPrice': 2.0, 'askPrice': 2.1, 'volume': 200, 'fmpLast': 2.05}]
+        content = orjson.dumps(quotes)
+        with patch.object(self.loader._session, 'get', side_effect=lambda *args, **kwargs: make_response(content=content)):
+            pd.testing.assert_frame_equal(self.loader.fetch_all_prices(), self.loader.fetch_all_prices(stream=True))
+            screener_df = self.loader.fetch_stock_screener_results(stream=True, columns=['symbol', 'bidPrice'])
+
+        self.assertEqual(list(screener_df.columns), ['symbol', 'bidPrice'])
+        self.assertEqual(len(screener_df), 2)
+
+    def test_streamed_screener_float_fields_match(self):
+        # Whole-number values decode as ints, both paths must still return float64 columns
+        securities = [{'symbol': 'A', 'companyName': 'A Inc', 'marketCap': 1000, 'price': 10, 'beta': 1, 'exchange': 'NYSE'},
+                      {'symbol': 'B', 'companyName': 'B Inc', 'marketCap': 2000, 'price': 20, 'beta': None, 'exchange': 'NASDAQ'}]
+        content = orjson.dumps(securities)
+        with patch.object(self.loader._session, 'get', side_effect=lambda *args, **kwargs: make_response(content=content)):
+            screener_df = self.loader.fetch_stock_screener_results()
+            streamed_df = self.loader.fetch_stock_screener_results(stream=True)
+
+        pd.testing.assert_frame_equal(screener_df, streamed_df)
+        self.assertEqual(streamed_df['marketCap'].dtype, np.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from botrading.base.enums import TiingoDailyInterval
+from botrading.data_loaders.tiingo_data_loader import TiingoDataLoader
+
+
+class TestTiingoDataLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = TiingoDataLoader('test-key', max_workers=4)
+
+    @patch.object(TiingoDataLoader, 'fetch_end_of_day_prices')
+    def test_fetch_multiple_end_of_day_prices(self, mock_fetch):
+        def fetch(symbol, *args, **kwargs):
+            if symbol == 'BAD':
+                raise OSError("cache not writable")
+            return pd.DataFrame({'close': [1.0]})
+        mock_fetch.side_effect = fetch
+
+        with self.assertLogs('botrading.data_loaders.tiingo_data_loader', level='WARNING'):
+            prices_dict = self.loader.fetch_multiple_end_of_day_prices(['A', 'BAD', 'C'], '2024-01-01', '2024-01-31',
+                                                                       TiingoDailyInterval.DAILY)
+
+        self.assertEqual(list(prices_dict), ['A', 'BAD', 'C'])
+        self.assertIsNone(prices_dict['BAD'])
+        self.assertEqual(len(prices_dict['C']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()